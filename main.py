@@ -10,6 +10,7 @@ from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont
 
 from src.main_window import MainWindow
+from src.styles import get_palette
 
 
 def main():
@@ -34,6 +35,10 @@ def main():
         font = QFont("Segoe UI", 13)
     app.setFont(font)
     
+    # Base colors come from the palette so the stylesheet only has to
+    # carry the rules that differ from it
+    app.setPalette(get_palette())
+    
     # Create and show main window
     window = MainWindow()
     window.show()
@@ -4,106 +4,336 @@ Uses QPainter for custom drawing since we don't have matplotlib in PySide6.
 """
 
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame, QPushButton,
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QButtonGroup, QSizePolicy
 )
-from PySide6.QtCore import Qt, QRectF, QPointF
-from PySide6.QtGui import QPainter, QPen, QColor, QBrush, QPainterPath, QLinearGradient
+from PySide6.QtCore import Qt, QRectF, QPointF, QSize
+from PySide6.QtGui import (
+    QPainter, QPen, QColor, QBrush, QPainterPath, QLinearGradient, QPolygonF,
+    QPixmap, QPixmapCache
+)
 from ..styles import COLORS, format_currency, format_percent
-from datetime import datetime, timedelta
 
 
-class LineChart(QWidget):
-    """Simple line chart widget for portfolio value."""
+# Drawing styles never change, so they are built once and shared by every chart
+_ACCENT_GREEN = QColor(COLORS['accent_green'])
+_ACCENT_GREEN_LIGHT = _ACCENT_GREEN.lighter(150)
+_BG_SECONDARY = QColor(COLORS['bg_secondary'])
+
+_LINE_PEN = QPen(_ACCENT_GREEN)
+_LINE_PEN.setWidth(2)
+
+_POINT_PEN = QPen(_ACCENT_GREEN)
+_POINT_PEN.setWidth(8)
+_POINT_PEN.setCapStyle(Qt.RoundCap)
+
+_BAR_BRUSH = QBrush(_ACCENT_GREEN)
+
+_CARD_BRUSH = QBrush(QColor(COLORS['bg_secondary']))
+_CARD_PEN = QPen(QColor(COLORS['border']))
+_CARD_PEN.setWidth(1)
+_CARD_RADIUS = 12
+# Border plus the 16px padding the application stylesheet gives QFrame#card
+_CARD_MARGIN = 17
+
+
+def _normalize(values: list[float], min_val: float, val_range: float) -> list[float]:
+    """Map values onto 0..1 relative to min_val in a single pass."""
+    scale = 1 / val_range
+    return [(v - min_val) * scale for v in values]
+
+
+def _downsample(points: list[tuple[float, float]], threshold: int) -> list[tuple[float, float]]:
+    """Reduce points to threshold using largest-triangle-three-buckets.
+    
+    Keeps the first and last points and, from each bucket in between, the point
+    forming the largest triangle with its neighbours, which preserves peaks
+    and troughs far better than a plain stride.
+    """
+    count = len(points)
+    if threshold >= count or threshold < 3:
+        return points
+    
+    sampled = [points[0]]
+    bucket_size = (count - 2) / (threshold - 2)
+    a = 0
+    for i in range(threshold - 2):
+        # Average of the next bucket is the third triangle vertex
+        next_start = int((i + 1) * bucket_size) + 1
+        next_end = min(int((i + 2) * bucket_size) + 1, count)
+        next_bucket = points[next_start:next_end]
+        avg_x = sum(p[0] for p in next_bucket) / len(next_bucket)
+        avg_y = sum(p[1] for p in next_bucket) / len(next_bucket)
+        
+        ax, ay = points[a]
+        best_area = -1.0
+        best = a
+        for j in range(int(i * bucket_size) + 1, next_start):
+            px, py = points[j]
+            area = abs((ax - avg_x) * (py - ay) - (ax - px) * (avg_y - ay))
+            if area > best_area:
+                best_area = area
+                best = j
+        sampled.append(points[best])
+        a = best
+    
+    sampled.append(points[-1])
+    return sampled
+
+# Stylesheets are formatted once at import and shared by every card instance
+_TAB_QSS = f"""
+    QPushButton#tab {{
+        background-color: transparent;
+        border: none;
+        border-radius: 4px;
+        padding: 4px 8px;
+        color: {COLORS['text_secondary']};
+        font-size: 12px;
+    }}
+    QPushButton#tab:hover {{
+        background-color: {COLORS['bg_hover']};
+        color: {COLORS['text_primary']};
+    }}
+    QPushButton#tab:checked {{
+        background-color: {COLORS['accent_green_dark']};
+        color: {COLORS['bg_dark']};
+    }}
+"""
+
+_VALUE_QSS = f"""
+    font-size: 32px;
+    font-weight: 700;
+    color: {COLORS['text_primary']};
+"""
+
+# Change labels carry both colors and pick one through their "sign" property,
+# so a sign flip only repolishes the label instead of re-parsing its sheet
+_CHANGE_QSS = f"""
+    QLabel {{ font-size: 14px; color: {COLORS['accent_green']}; }}
+    QLabel[sign="neg"] {{ color: {COLORS['accent_red']}; }}
+"""
+
+_TITLE_QSS = f"""
+    font-size: 18px;
+    font-weight: 600;
+    color: {COLORS['text_primary']};
+"""
+
+_INCOME_VALUE_QSS = f"""
+    font-size: 24px;
+    font-weight: 700;
+    color: {COLORS['accent_green']};
+"""
+
+_STAT_QSS = f"""
+    QLabel {{ color: {COLORS['text_muted']}; font-size: 12px; }}
+    QLabel[sign="pos"] {{ color: {COLORS['accent_green']}; }}
+    QLabel[sign="neg"] {{ color: {COLORS['accent_red']}; }}
+"""
+
+
+def _set_sign(label: QLabel, positive: bool):
+    """Switch a change label between its up and down colors when the sign flips."""
+    sign = "pos" if positive else "neg"
+    if label.property("sign") != sign:
+        label.setProperty("sign", sign)
+        style = label.style()
+        style.unpolish(label)
+        style.polish(label)
+
+
+def _render_card_background(size: QSize, dpr: float) -> QPixmap:
+    """Return the rounded card chrome for a size, shared through QPixmapCache."""
+    key = f"chart_card:{size.width()}x{size.height()}@{dpr}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None:
+        pixmap = QPixmap(size * dpr)
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
+        
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setBrush(_CARD_BRUSH)
+        painter.setPen(_CARD_PEN)
+        rect = QRectF(0.5, 0.5, size.width() - 1, size.height() - 1)
+        painter.drawRoundedRect(rect, _CARD_RADIUS, _CARD_RADIUS)
+        painter.end()
+        
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+class _CardFrame(QWidget):
+    """Card container that blits cached chrome instead of styling a QFrame."""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setContentsMargins(_CARD_MARGIN, _CARD_MARGIN, _CARD_MARGIN, _CARD_MARGIN)
+    
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, _render_card_background(self.size(), self.devicePixelRatioF()))
+
+
+class _CachedChart(QWidget):
+    """Base for charts that render into a cached pixmap and blit it on repaint."""
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.data = []
-        self.setMinimumHeight(200)
+        self._cache_pixmap = None
+        self._cache_key = None
+        self._update_pending = False
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
     
     def set_data(self, data: list[tuple[str, float]]):
-        """Set chart data as list of (date_str, value) tuples."""
+        """Set chart data as list of (label, value) tuples."""
         self.data = data
-        self.update()
+        self._cache_pixmap = None
+        # A burst of updates before the next paint only needs one repaint request
+        if not self._update_pending:
+            self._update_pending = True
+            self.update()
     
     def paintEvent(self, event):
-        if not self.data:
+        self._update_pending = False
+        if not self.data or not self.isVisible() or self.width() <= 0 or self.height() <= 0:
             return
         
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
+        # Only re-render when the data or the widget size changed
+        dpr = self.devicePixelRatioF()
+        key = (id(self.data), self.width(), self.height(), dpr)
+        if self._cache_pixmap is None or key != self._cache_key:
+            pixmap = QPixmap(self.size() * dpr)
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.transparent)
+            
+            pixmap_painter = QPainter(pixmap)
+            self._render(pixmap_painter)
+            pixmap_painter.end()
+            
+            self._cache_pixmap = pixmap
+            self._cache_key = key
         
-        # Chart dimensions
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._cache_pixmap)
+    
+    def _render(self, painter: QPainter):
+        """Draw the chart with the given painter; subclasses fill this in."""
+
+
+class LineChart(_CachedChart):
+    """Simple line chart widget for portfolio value."""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._unit_points = []
+        self._min_val = self._max_val = 0.0
+        self._val_range = 1
+        self._points = QPolygonF()
+        self._fill_path = QPainterPath()
+        self._gradient_brush = None
+        self._gradient_height = None
+        self.setMinimumHeight(200)
+    
+    def set_data(self, data: list[tuple[str, float]]):
+        """Set chart data as list of (date_str, value) tuples."""
+        # Normalize to 0..1 once per data change so layout only has to scale
+        self._unit_points = []
+        if data:
+            values = [v for _, v in data]
+            low = high = values[0]
+            for v in values:
+                if v < low:
+                    low = v
+                elif v > high:
+                    high = v
+            self._min_val = low * 0.95
+            self._max_val = high * 1.05
+            self._val_range = self._max_val - self._min_val if self._max_val != self._min_val else 1
+            
+            unit_values = _normalize(values, self._min_val, self._val_range)
+            last = len(values) - 1
+            if last:
+                self._unit_points = [(i / last, fy) for i, fy in enumerate(unit_values)]
+            else:
+                self._unit_points = [(0.5, unit_values[0])]
+        
+        self._layout_points()
+        super().set_data(data)
+    
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._layout_points()
+    
+    def _layout_points(self):
+        """Scale the normalized points and the fill outline to the current size."""
         margin = 10
         width = self.width() - 2 * margin
         height = self.height() - 2 * margin
         
-        if width <= 0 or height <= 0:
+        if not self._unit_points or width <= 0 or height <= 0:
+            self._points = QPolygonF()
+            self._fill_path = QPainterPath()
             return
         
-        # Get value range
-        values = [v for _, v in self.data]
-        min_val = min(values) * 0.95
-        max_val = max(values) * 1.05
-        val_range = max_val - min_val if max_val != min_val else 1
-        
-        # Calculate points
-        points = []
-        for i, (_, value) in enumerate(self.data):
-            x = margin + (i / (len(self.data) - 1)) * width if len(self.data) > 1 else margin + width / 2
-            y = margin + height - ((value - min_val) / val_range) * height
-            points.append(QPointF(x, y))
-        
-        # Draw gradient fill
-        if points:
-            gradient = QLinearGradient(0, margin, 0, margin + height)
-            gradient.setColorAt(0, QColor(COLORS['accent_green']).lighter(150))
-            gradient.setColorAt(1, QColor(COLORS['bg_secondary']))
-            
-            fill_path = QPainterPath()
-            fill_path.moveTo(points[0].x(), margin + height)
-            for pt in points:
-                fill_path.lineTo(pt)
-            fill_path.lineTo(points[-1].x(), margin + height)
-            fill_path.closeSubpath()
-            
-            painter.fillPath(fill_path, QBrush(gradient))
+        # Series much denser than the chart would only overdraw the same pixels
+        unit_points = self._unit_points
+        if len(unit_points) > 2 * width:
+            unit_points = _downsample(unit_points, 2 * width)
+        
+        bottom = margin + height
+        point_list = [QPointF(margin + fx * width, bottom - fy * height) for fx, fy in unit_points]
+        self._points = QPolygonF(point_list)
+        
+        fill_polygon = QPolygonF(point_list + [
+            QPointF(point_list[-1].x(), bottom),
+            QPointF(point_list[0].x(), bottom),
+        ])
+        self._fill_path = QPainterPath()
+        self._fill_path.addPolygon(fill_polygon)
+        self._fill_path.closeSubpath()
+    
+    def _render(self, painter: QPainter):
+        if self._points.isEmpty():
+            return
+        
+        # Chart dimensions
+        margin = 10
+        width = self.width() - 2 * margin
+        height = self.height() - 2 * margin
         
-        # Draw line
-        pen = QPen(QColor(COLORS['accent_green']))
-        pen.setWidth(2)
-        painter.setPen(pen)
+        # Draw gradient fill (the gradient only depends on the chart height)
+        if self._gradient_height != height:
+            gradient = QLinearGradient(0, margin, 0, margin + height)
+            gradient.setColorAt(0, _ACCENT_GREEN_LIGHT)
+            gradient.setColorAt(1, _BG_SECONDARY)
+            self._gradient_brush = QBrush(gradient)
+            self._gradient_height = height
         
-        for i in range(len(points) - 1):
-            painter.drawLine(points[i], points[i + 1])
+        painter.fillPath(self._fill_path, self._gradient_brush)
         
-        # Draw points
-        painter.setBrush(QBrush(QColor(COLORS['accent_green'])))
-        for pt in points:
-            painter.drawEllipse(pt, 3, 3)
+        # Draw line (only the stroke is antialiased; the line covers the fill's edge)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(_LINE_PEN)
+        painter.drawPolyline(self._points)
+        
+        # Draw points (a round-capped pen draws each point as a filled dot),
+        # skipped once the series is denser than the available pixels
+        if len(self.data) <= width:
+            painter.setPen(_POINT_PEN)
+            painter.drawPoints(self._points)
 
 
-class BarChart(QWidget):
+class BarChart(_CachedChart):
     """Simple bar chart widget for monthly income."""
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.data = []
         self.setMinimumHeight(150)
-        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
     
-    def set_data(self, data: list[tuple[str, float]]):
-        """Set chart data as list of (label, value) tuples."""
-        self.data = data
-        self.update()
-    
-    def paintEvent(self, event):
-        if not self.data:
-            return
-        
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
+    def _render(self, painter: QPainter):
+        # Bars are axis-aligned and snapped to whole pixels, so no antialiasing
         
         # Chart dimensions
         margin = 10
@@ -123,21 +353,45 @@ class BarChart(QWidget):
         bar_width = max(4, (width / len(self.data)) * 0.7)
         gap = (width / len(self.data)) * 0.3
         
-        for i, (label, value) in enumerate(self.data):
-            x = margin + i * (bar_width + gap)
-            bar_height = (value / max_val) * height if max_val > 0 else 0
-            y = margin + height - bar_height
-            
-            # Choose color based on whether it's today's month
-            color = QColor(COLORS['accent_green'])
-            
-            # Draw bar
-            painter.setBrush(QBrush(color))
-            painter.setPen(Qt.NoPen)
-            painter.drawRoundedRect(QRectF(x, y, bar_width, bar_height), 2, 2)
+        # All bars share one style, so collect them into a single path
+        bars_path = QPainterPath()
+        bottom = margin + height
+        pixel_width = round(bar_width)
+        fractions = _normalize(values, 0, max_val) if max_val > 0 else [0] * len(values)
+        for i, fraction in enumerate(fractions):
+            x = round(margin + i * (bar_width + gap))
+            y = round(bottom - fraction * height)
+            bars_path.addRoundedRect(QRectF(x, y, pixel_width, bottom - y), 2, 2)
+        
+        # Draw bars
+        painter.setBrush(_BAR_BRUSH)
+        painter.setPen(Qt.NoPen)
+        painter.drawPath(bars_path)
+
+
+class _ChartCard(QWidget):
+    """Base for cards that feed a chart, deferring updates while hidden."""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pending_chart_data = None
+    
+    def _set_chart_data(self, chart_data: list):
+        # Hidden cards keep only the latest series and hand it over when shown
+        if self.isVisible():
+            self._pending_chart_data = None
+            self.chart.set_data(chart_data)
+        else:
+            self._pending_chart_data = chart_data
+    
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._pending_chart_data is not None:
+            self.chart.set_data(self._pending_chart_data)
+            self._pending_chart_data = None
 
 
-class PortfolioChartCard(QWidget):
+class PortfolioChartCard(_ChartCard):
     """Card containing portfolio value chart with timeframe selectors."""
     
     def __init__(self, parent=None):
@@ -152,15 +406,8 @@ class PortfolioChartCard(QWidget):
         layout.setContentsMargins(0, 0, 0, 0)
         
         # Main card frame
-        card = QFrame()
-        card.setObjectName("card")
-        card.setStyleSheet(f"""
-            QFrame#card {{
-                background-color: {COLORS['bg_secondary']};
-                border: 1px solid {COLORS['border']};
-                border-radius: 12px;
-            }}
-        """)
+        card = _CardFrame()
+        card.setStyleSheet(_TAB_QSS)
         
         card_layout = QVBoxLayout(card)
         card_layout.setSpacing(12)
@@ -169,18 +416,12 @@ class PortfolioChartCard(QWidget):
         value_layout = QHBoxLayout()
         
         self.value_label = QLabel("$0.00")
-        self.value_label.setStyleSheet(f"""
-            font-size: 32px;
-            font-weight: 700;
-            color: {COLORS['text_primary']};
-        """)
+        self.value_label.setStyleSheet(_VALUE_QSS)
         value_layout.addWidget(self.value_label)
         
         self.change_label = QLabel("$0.00 (0.00%)")
-        self.change_label.setStyleSheet(f"""
-            font-size: 14px;
-            color: {COLORS['accent_green']};
-        """)
+        self.change_label.setProperty("sign", "pos")
+        self.change_label.setStyleSheet(_CHANGE_QSS)
         value_layout.addWidget(self.change_label)
         value_layout.addStretch()
         
@@ -201,24 +442,6 @@ class PortfolioChartCard(QWidget):
             btn = QPushButton(tf)
             btn.setCheckable(True)
             btn.setObjectName("tab")
-            btn.setStyleSheet(f"""
-                QPushButton#tab {{
-                    background-color: transparent;
-                    border: none;
-                    border-radius: 4px;
-                    padding: 4px 8px;
-                    color: {COLORS['text_secondary']};
-                    font-size: 12px;
-                }}
-                QPushButton#tab:hover {{
-                    background-color: {COLORS['bg_hover']};
-                    color: {COLORS['text_primary']};
-                }}
-                QPushButton#tab:checked {{
-                    background-color: {COLORS['accent_green_dark']};
-                    color: {COLORS['bg_dark']};
-                }}
-            """)
             if tf == "1W":
                 btn.setChecked(True)
             self.timeframe_group.addButton(btn, i)
@@ -237,15 +460,14 @@ class PortfolioChartCard(QWidget):
         
         self.value_label.setText(format_currency(value))
         
-        change_color = COLORS['accent_green'] if change >= 0 else COLORS['accent_red']
         arrow = "▲" if change >= 0 else "▼"
         self.change_label.setText(f"{arrow} {format_currency(abs(change))} ({format_percent(change_pct)})")
-        self.change_label.setStyleSheet(f"font-size: 14px; color: {change_color};")
+        _set_sign(self.change_label, change >= 0)
         
-        self.chart.set_data(chart_data)
+        self._set_chart_data(chart_data)
 
 
-class OptionsIncomeCard(QWidget):
+class OptionsIncomeCard(_ChartCard):
     """Card showing options income bar chart."""
     
     def __init__(self, parent=None):
@@ -257,15 +479,8 @@ class OptionsIncomeCard(QWidget):
         layout.setContentsMargins(0, 0, 0, 0)
         
         # Main card frame
-        card = QFrame()
-        card.setObjectName("card")
-        card.setStyleSheet(f"""
-            QFrame#card {{
-                background-color: {COLORS['bg_secondary']};
-                border: 1px solid {COLORS['border']};
-                border-radius: 12px;
-            }}
-        """)
+        card = _CardFrame()
+        card.setStyleSheet(_TAB_QSS)
         
         card_layout = QVBoxLayout(card)
         card_layout.setSpacing(12)
@@ -274,19 +489,11 @@ class OptionsIncomeCard(QWidget):
         header_layout = QHBoxLayout()
         
         title = QLabel("Options")
-        title.setStyleSheet(f"""
-            font-size: 18px;
-            font-weight: 600;
-            color: {COLORS['text_primary']};
-        """)
+        title.setStyleSheet(_TITLE_QSS)
         header_layout.addWidget(title)
         
         self.value_label = QLabel("+$0.00")
-        self.value_label.setStyleSheet(f"""
-            font-size: 24px;
-            font-weight: 700;
-            color: {COLORS['accent_green']};
-        """)
+        self.value_label.setStyleSheet(_INCOME_VALUE_QSS)
         header_layout.addWidget(self.value_label)
         header_layout.addStretch()
         
@@ -296,11 +503,12 @@ class OptionsIncomeCard(QWidget):
         stats_layout = QHBoxLayout()
         
         self.week_change = QLabel("Past week")
-        self.week_change.setStyleSheet(f"color: {COLORS['text_muted']}; font-size: 12px;")
+        self.week_change.setStyleSheet(_STAT_QSS)
         stats_layout.addWidget(self.week_change)
         
         self.today_change = QLabel("Today")
-        self.today_change.setStyleSheet(f"color: {COLORS['accent_green']}; font-size: 12px;")
+        self.today_change.setProperty("sign", "pos")
+        self.today_change.setStyleSheet(_STAT_QSS)
         stats_layout.addWidget(self.today_change)
         stats_layout.addStretch()
         
@@ -321,23 +529,6 @@ class OptionsIncomeCard(QWidget):
             btn = QPushButton(tf)
             btn.setCheckable(True)
             btn.setObjectName("tab")
-            btn.setStyleSheet(f"""
-                QPushButton#tab {{
-                    background-color: transparent;
-                    border: none;
-                    border-radius: 4px;
-                    padding: 4px 8px;
-                    color: {COLORS['text_secondary']};
-                    font-size: 12px;
-                }}
-                QPushButton#tab:hover {{
-                    background-color: {COLORS['bg_hover']};
-                }}
-                QPushButton#tab:checked {{
-                    background-color: {COLORS['accent_green_dark']};
-                    color: {COLORS['bg_dark']};
-                }}
-            """)
             if tf == "1W":
                 btn.setChecked(True)
             self.timeframe_group.addButton(btn, i)
@@ -352,12 +543,10 @@ class OptionsIncomeCard(QWidget):
         """Update the options income data."""
         self.value_label.setText(f"+{format_currency(total)}")
         
-        week_color = COLORS['accent_green'] if week_change >= 0 else COLORS['accent_red']
         self.week_change.setText(f"{format_percent(week_change)} Past week")
-        self.week_change.setStyleSheet(f"color: {week_color}; font-size: 12px;")
+        _set_sign(self.week_change, week_change >= 0)
         
-        today_color = COLORS['accent_green'] if today_change >= 0 else COLORS['accent_red']
         self.today_change.setText(f"{format_currency(today_change)} Today")
-        self.today_change.setStyleSheet(f"color: {today_color}; font-size: 12px;")
+        _set_sign(self.today_change, today_change >= 0)
         
-        self.chart.set_data(chart_data)
+        self._set_chart_data(chart_data)
@@ -3,6 +3,8 @@ Market rankings component.
 Compares options performance vs major market indices.
 """
 
+from functools import lru_cache
+
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame, 
     QPushButton, QButtonGroup, QGridLayout
@@ -11,38 +13,94 @@ from PySide6.QtCore import Qt
 from ..styles import COLORS, format_percent
 
 
+# Ranking items and performer rows are styled from the card stylesheet by
+# object name and dynamic property instead of carrying their own. It is
+# formatted once at import and shared by both cards.
+_CARD_QSS = f"""
+    QWidget#ranking_item {{
+        background-color: {COLORS['bg_card']};
+        border-radius: 6px;
+    }}
+    QWidget#ranking_item[highlighted="true"] {{
+        background-color: {COLORS['accent_green_dark']};
+    }}
+    QLabel#ranking_name {{
+        color: {COLORS['text_primary']};
+        font-weight: 500;
+        background: transparent;
+    }}
+    QLabel#ranking_perf {{
+        color: {COLORS['accent_green']};
+        font-weight: 600;
+        background: transparent;
+    }}
+    QLabel#ranking_perf[positive="false"] {{
+        color: {COLORS['accent_red']};
+    }}
+    QLabel#performer_ticker {{
+        color: {COLORS['text_primary']};
+        font-weight: 500;
+    }}
+    QLabel#performer_amount {{
+        color: {COLORS['accent_green']};
+        font-weight: 600;
+    }}
+"""
+
+
+@lru_cache(maxsize=512)
+def _fmt_amount(amount: float) -> str:
+    """Format a performer amount as whole dollars."""
+    return f"${amount:,.0f}"
+
+
+def _repolish(widget: QWidget):
+    """Re-apply inherited stylesheet rules after a dynamic property change."""
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+
+
 class RankingItem(QWidget):
     """Single ranking item with name and performance."""
     
     def __init__(self, name: str, performance: float, highlighted: bool = False, parent=None):
         super().__init__(parent)
-        self.setup_ui(name, performance, highlighted)
+        self._highlighted = None
+        self._positive = None
+        self.setup_ui()
+        self.set_values(name, performance, highlighted)
     
-    def setup_ui(self, name: str, performance: float, highlighted: bool):
+    def setup_ui(self):
+        self.setObjectName("ranking_item")
         layout = QHBoxLayout(self)
         layout.setContentsMargins(12, 8, 12, 8)
         
-        # Container styling
-        bg_color = COLORS['accent_green_dark'] if highlighted else COLORS['bg_card']
-        text_color = COLORS['text_primary']
-        perf_color = COLORS['accent_green'] if performance >= 0 else COLORS['accent_red']
-        
-        self.setStyleSheet(f"""
-            QWidget {{
-                background-color: {bg_color};
-                border-radius: 6px;
-            }}
-        """)
-        
-        name_label = QLabel(name)
-        name_label.setStyleSheet(f"color: {text_color}; font-weight: 500; background: transparent;")
-        layout.addWidget(name_label)
+        self.name_label = QLabel()
+        self.name_label.setObjectName("ranking_name")
+        layout.addWidget(self.name_label)
         
         layout.addStretch()
         
-        perf_label = QLabel(format_percent(performance))
-        perf_label.setStyleSheet(f"color: {perf_color}; font-weight: 600; background: transparent;")
-        layout.addWidget(perf_label)
+        self.perf_label = QLabel()
+        self.perf_label.setObjectName("ranking_perf")
+        layout.addWidget(self.perf_label)
+    
+    def set_values(self, name: str, performance: float, highlighted: bool = False):
+        """Update the item in place, restyling only when its state changes."""
+        self.name_label.setText(name)
+        self.perf_label.setText(format_percent(performance))
+        
+        if highlighted != self._highlighted:
+            self.setProperty("highlighted", highlighted)
+            _repolish(self)
+            self._highlighted = highlighted
+        
+        positive = performance >= 0
+        if positive != self._positive:
+            self.perf_label.setProperty("positive", positive)
+            _repolish(self.perf_label)
+            self._positive = positive
 
 
 class MarketRankingsCard(QWidget):
@@ -51,6 +109,7 @@ class MarketRankingsCard(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.current_period = 'ytd'
+        self._ranking_pool: list[RankingItem] = []
         self.setup_ui()
     
     def setup_ui(self):
@@ -60,13 +119,7 @@ class MarketRankingsCard(QWidget):
         # Main card frame
         card = QFrame()
         card.setObjectName("card")
-        card.setStyleSheet(f"""
-            QFrame#card {{
-                background-color: {COLORS['bg_secondary']};
-                border: 1px solid {COLORS['border']};
-                border-radius: 12px;
-            }}
-        """)
+        card.setStyleSheet(_CARD_QSS)
         
         card_layout = QVBoxLayout(card)
         card_layout.setSpacing(12)
@@ -75,11 +128,7 @@ class MarketRankingsCard(QWidget):
         header_layout = QHBoxLayout()
         
         title = QLabel("📊 Market Rankings")
-        title.setStyleSheet(f"""
-            font-size: 16px;
-            font-weight: 600;
-            color: {COLORS['text_primary']};
-        """)
+        title.setObjectName("card_title")
         header_layout.addWidget(title)
         header_layout.addStretch()
         card_layout.addLayout(header_layout)
@@ -124,12 +173,6 @@ class MarketRankingsCard(QWidget):
     
     def _update_rankings(self, data: list):
         """Update the rankings display."""
-        # Clear existing items
-        while self.rankings_layout.count():
-            item = self.rankings_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        
         # Default sample data if no data provided
         if not data:
             data = [
@@ -140,9 +183,19 @@ class MarketRankingsCard(QWidget):
                 ("Nasdaq", 1.18, False),
             ]
         
-        for name, perf, highlighted in data:
-            item = RankingItem(name, perf, highlighted)
-            self.rankings_layout.addWidget(item)
+        # Reuse pooled items, only creating widgets when the list grows
+        for i, (name, perf, highlighted) in enumerate(data):
+            if i < len(self._ranking_pool):
+                item = self._ranking_pool[i]
+                item.set_values(name, perf, highlighted)
+            else:
+                item = RankingItem(name, perf, highlighted)
+                self._ranking_pool.append(item)
+                self.rankings_layout.addWidget(item)
+            item.setVisible(True)
+        
+        for item in self._ranking_pool[len(data):]:
+            item.setVisible(False)
     
     def update_data(self, options_perf: float, market_data: dict):
         """Update with actual performance data."""
@@ -162,11 +215,43 @@ class MarketRankingsCard(QWidget):
         self._update_rankings(rankings)
 
 
+class PerformerRow(QWidget):
+    """Single top performer row with ticker and premium amount."""
+    
+    def __init__(self, ticker: str, amount: float, parent=None):
+        super().__init__(parent)
+        self.setup_ui()
+        self.set_values(ticker, amount)
+    
+    def setup_ui(self):
+        # Paint the inherited stylesheet background like a plain QWidget row did
+        self.setAttribute(Qt.WA_StyledBackground, True)
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(8, 4, 8, 4)
+        
+        self.ticker_label = QLabel()
+        self.ticker_label.setObjectName("performer_ticker")
+        layout.addWidget(self.ticker_label)
+        
+        layout.addStretch()
+        
+        self.amount_label = QLabel()
+        self.amount_label.setObjectName("performer_amount")
+        layout.addWidget(self.amount_label)
+    
+    def set_values(self, ticker: str, amount: float):
+        """Update the row in place."""
+        self.ticker_label.setText(ticker)
+        self.amount_label.setText(_fmt_amount(amount))
+
+
 class TopPerformersCard(QWidget):
     """Card showing top performing tickers."""
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._mtd_pool: list[PerformerRow] = []
+        self._ytd_pool: list[PerformerRow] = []
         self.setup_ui()
     
     def setup_ui(self):
@@ -176,13 +261,7 @@ class TopPerformersCard(QWidget):
         # Main card frame
         card = QFrame()
         card.setObjectName("card")
-        card.setStyleSheet(f"""
-            QFrame#card {{
-                background-color: {COLORS['bg_secondary']};
-                border: 1px solid {COLORS['border']};
-                border-radius: 12px;
-            }}
-        """)
+        card.setStyleSheet(_CARD_QSS)
         
         card_layout = QVBoxLayout(card)
         card_layout.setSpacing(12)
@@ -191,11 +270,7 @@ class TopPerformersCard(QWidget):
         header_layout = QHBoxLayout()
         
         title = QLabel("🏆 Top Performers")
-        title.setStyleSheet(f"""
-            font-size: 16px;
-            font-weight: 600;
-            color: {COLORS['text_primary']};
-        """)
+        title.setObjectName("card_title")
         header_layout.addWidget(title)
         header_layout.addStretch()
         card_layout.addLayout(header_layout)
@@ -239,46 +314,25 @@ class TopPerformersCard(QWidget):
         card_layout.addStretch()
         layout.addWidget(card)
     
-    def _create_performer_row(self, ticker: str, amount: float) -> QWidget:
-        """Create a single performer row."""
-        widget = QWidget()
-        layout = QHBoxLayout(widget)
-        layout.setContentsMargins(8, 4, 8, 4)
-        
-        ticker_label = QLabel(ticker)
-        ticker_label.setStyleSheet(f"color: {COLORS['text_primary']}; font-weight: 500;")
-        layout.addWidget(ticker_label)
-        
-        layout.addStretch()
-        
-        amount_label = QLabel(f"${amount:,.0f}")
-        amount_label.setStyleSheet(f"color: {COLORS['accent_green']}; font-weight: 600;")
-        layout.addWidget(amount_label)
-        
-        return widget
+    def _update_column(self, layout: QVBoxLayout, pool: list[PerformerRow], performers: list):
+        """Show performers in a column, reusing its pooled rows."""
+        performers = performers[:5]
+        for i, performer in enumerate(performers):
+            ticker = performer.get('ticker', 'N/A')
+            amount = performer.get('total_premium', 0)
+            if i < len(pool):
+                row = pool[i]
+                row.set_values(ticker, amount)
+            else:
+                row = PerformerRow(ticker, amount)
+                pool.append(row)
+                layout.addWidget(row)
+            row.setVisible(True)
+        
+        for row in pool[len(performers):]:
+            row.setVisible(False)
     
     def update_data(self, mtd_performers: list, ytd_performers: list):
         """Update the top performers data."""
-        # Clear MTD
-        while self.mtd_layout.count():
-            item = self.mtd_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        
-        # Clear YTD
-        while self.ytd_layout.count():
-            item = self.ytd_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        
-        # Add MTD performers
-        for performer in mtd_performers[:5]:
-            ticker = performer.get('ticker', 'N/A')
-            amount = performer.get('total_premium', 0)
-            self.mtd_layout.addWidget(self._create_performer_row(ticker, amount))
-        
-        # Add YTD performers
-        for performer in ytd_performers[:5]:
-            ticker = performer.get('ticker', 'N/A')
-            amount = performer.get('total_premium', 0)
-            self.ytd_layout.addWidget(self._create_performer_row(ticker, amount))
+        self._update_column(self.mtd_layout, self._mtd_pool, mtd_performers)
+        self._update_column(self.ytd_layout, self._ytd_pool, ytd_performers)
@@ -3,16 +3,122 @@ Portfolio overview card component.
 Displays investment philosophy and milestones (configurable).
 """
 
+from dataclasses import dataclass
+
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame, QGridLayout,
     QPushButton, QDialog, QLineEdit, QTextEdit, QFormLayout, QMessageBox,
-    QScrollArea, QSpinBox, QDoubleSpinBox
+    QScrollArea, QSpinBox, QDoubleSpinBox, QTableView, QHeaderView,
+    QAbstractItemView, QStyledItemDelegate
+)
+from PySide6.QtCore import (
+    Qt, Signal, QObject, QRunnable, QThreadPool, QAbstractTableModel, QModelIndex
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtGui import QColor, QPalette
 from ..styles import COLORS, format_currency
 from ..lib.database import get_database
 
 
+# Content stylesheets are formatted once at import and reused on every refresh
+_PHILOSOPHY_QSS = f"color: {COLORS['text_secondary']}; font-size: 13px; line-height: 1.5;"
+_STARTED_VALUE_QSS = f"color: {COLORS['text_primary']}; font-size: 12px;"
+_MILESTONES_VIEW_QSS = "QTableView { border: none; }"
+
+# Milestone remove buttons are styled once from the dialog stylesheet
+_EDIT_DIALOG_QSS = f"""
+    QDialog {{ background-color: {COLORS['bg_primary']}; }}
+    QPushButton[removeRow="true"] {{
+        background-color: {COLORS['accent_red']};
+        border: none;
+        color: white;
+        border-radius: 4px;
+    }}
+    QPushButton[removeRow="true"]:hover {{
+        background-color: {COLORS['accent_red_dark']};
+    }}
+"""
+
+
+@dataclass(slots=True, eq=False)
+class MilestoneRow:
+    """Input widgets of one milestone row in the edit dialog."""
+    amount: QDoubleSpinBox
+    date: QLineEdit
+    time: QLineEdit
+    layout: QHBoxLayout
+
+
+class MilestonesModel(QAbstractTableModel):
+    """Table model of portfolio milestones: amount, date reached, time to reach."""
+    
+    _KEYS = ('amount', 'date_reached', 'time_to_reach')
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._milestones: list[dict] = []
+    
+    def setMilestones(self, milestones: list[dict]):
+        """Replace all milestones in one model reset."""
+        self.beginResetModel()
+        self._milestones = milestones
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._milestones)
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._KEYS)
+    
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        value = self._milestones[index.row()].get(self._KEYS[index.column()], '')
+        if index.column() == 0:
+            return format_currency(value)
+        return value
+
+
+class _MilestoneDelegate(QStyledItemDelegate):
+    """Colors milestone cells by column through the item palette."""
+    
+    _COLORS = (
+        QColor(COLORS['text_primary']),
+        QColor(COLORS['text_secondary']),
+        QColor(COLORS['text_muted']),
+    )
+    
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        option.palette.setColor(QPalette.Text, self._COLORS[index.column()])
+        if index.column() == 0:
+            option.font.setWeight(option.font.Weight.Medium)
+
+
+class _PortfolioLoaderSignals(QObject):
+    loaded = Signal(object, object)
+    failed = Signal(str)
+
+
+class PortfolioLoader(QRunnable):
+    """Reads portfolio info and milestones on a thread pool thread."""
+    
+    def __init__(self, db):
+        super().__init__()
+        self.db = db
+        self.signals = _PortfolioLoaderSignals()
+    
+    def run(self):
+        try:
+            info = self.db.get_portfolio_info()
+            milestones = self.db.get_milestones()
+        except Exception as e:
+            self.signals.failed.emit(f"Failed to load portfolio data: {e}")
+        else:
+            self.signals.loaded.emit(info, milestones)
+        finally:
+            self.db.release_thread_connections()
+
+
 class EditPortfolioDialog(QDialog):
     """Dialog to edit portfolio information."""
     
@@ -23,8 +129,9 @@ class EditPortfolioDialog(QDialog):
         self.setWindowTitle("Edit Portfolio Info")
         self.setMinimumWidth(500)
         self.setMinimumHeight(600)
-        self.setStyleSheet(f"QDialog {{ background-color: {COLORS['bg_primary']}; }}")
-        self.milestone_widgets = []
+        self.setStyleSheet(_EDIT_DIALOG_QSS)
+        self.milestone_widgets: list[MilestoneRow] = []
+        self._loader = None
         self.setup_ui()
         self._load_data()
     
@@ -42,8 +149,8 @@ class EditPortfolioDialog(QDialog):
         scroll.setWidgetResizable(True)
         scroll.setStyleSheet("QScrollArea { border: none; }")
         
-        content = QWidget()
-        form = QVBoxLayout(content)
+        self._content = QWidget()
+        form = QVBoxLayout(self._content)
         form.setSpacing(16)
         
         # Started investing
@@ -77,7 +184,7 @@ class EditPortfolioDialog(QDialog):
         form.addLayout(self.milestones_layout)
         
         form.addStretch()
-        scroll.setWidget(content)
+        scroll.setWidget(self._content)
         layout.addWidget(scroll, 1)
         
         # Buttons
@@ -88,9 +195,9 @@ class EditPortfolioDialog(QDialog):
         cancel_btn.clicked.connect(self.reject)
         button_layout.addWidget(cancel_btn)
         
-        save_btn = QPushButton("Save")
-        save_btn.setObjectName("primary")
-        save_btn.setStyleSheet(f"""
+        self._save_btn = QPushButton("Save")
+        self._save_btn.setObjectName("primary")
+        self._save_btn.setStyleSheet(f"""
             QPushButton#primary {{
                 background-color: {COLORS['accent_green_dark']};
                 border: none;
@@ -103,8 +210,8 @@ class EditPortfolioDialog(QDialog):
                 background-color: {COLORS['accent_green']};
             }}
         """)
-        save_btn.clicked.connect(self._save)
-        button_layout.addWidget(save_btn)
+        self._save_btn.clicked.connect(self._save)
+        button_layout.addWidget(self._save_btn)
         
         layout.addLayout(button_layout)
     
@@ -133,32 +240,22 @@ class EditPortfolioDialog(QDialog):
         
         remove_btn = QPushButton("✕")
         remove_btn.setFixedWidth(30)
-        remove_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {COLORS['accent_red']};
-                border: none;
-                color: white;
-                border-radius: 4px;
-            }}
-            QPushButton:hover {{
-                background-color: {COLORS['accent_red_dark']};
-            }}
-        """)
+        remove_btn.setProperty("removeRow", True)
         
-        widget_data = {'amount': amount_input, 'date': date_input, 'time': time_input, 'layout': row}
-        remove_btn.clicked.connect(lambda: self._remove_milestone_row(widget_data))
+        milestone_row = MilestoneRow(amount_input, date_input, time_input, row)
+        remove_btn.clicked.connect(lambda: self._remove_milestone_row(milestone_row))
         row.addWidget(remove_btn)
         
-        self.milestone_widgets.append(widget_data)
+        self.milestone_widgets.append(milestone_row)
         self.milestones_layout.addLayout(row)
     
-    def _remove_milestone_row(self, widget_data: dict):
+    def _remove_milestone_row(self, milestone_row: MilestoneRow):
         """Remove a milestone row."""
-        if widget_data in self.milestone_widgets:
-            self.milestone_widgets.remove(widget_data)
+        if milestone_row in self.milestone_widgets:
+            self.milestone_widgets.remove(milestone_row)
             
             # Clear the layout
-            layout = widget_data['layout']
+            layout = milestone_row.layout
             while layout.count():
                 item = layout.takeAt(0)
                 if item.widget():
@@ -167,20 +264,49 @@ class EditPortfolioDialog(QDialog):
             self.milestones_layout.removeItem(layout)
     
     def _load_data(self):
-        """Load existing portfolio data."""
-        db = get_database()
-        
-        info = db.get_portfolio_info()
+        """Load existing portfolio data in the background."""
+        # Editing stays disabled until the current values have arrived
+        self._content.setEnabled(False)
+        self._save_btn.setEnabled(False)
+        
+        self._loader = PortfolioLoader(get_database())
+        self._loader.signals.loaded.connect(self._apply_data)
+        self._loader.signals.failed.connect(self._on_load_failed)
+        QThreadPool.globalInstance().start(self._loader)
+    
+    def _on_load_failed(self, text: str):
+        """Report a failed load and unlock the form so it can still be edited."""
+        self._loader = None
+        self._content.setEnabled(True)
+        self._save_btn.setEnabled(True)
+        QMessageBox.warning(self, "Error", text)
+    
+    def _apply_data(self, info: dict, milestones: list):
+        """Fill the form with loaded portfolio data."""
+        self._loader = None
         self.started_input.setText(info.get('started_investing', ''))
         self.philosophy_input.setPlainText(info.get('philosophy', ''))
         
-        milestones = db.get_milestones()
-        for m in milestones:
-            self._add_milestone_row(
-                m.get('amount', 0),
-                m.get('date_reached', ''),
-                m.get('time_to_reach', '')
-            )
+        # Refill existing rows in place and add or remove only the difference,
+        # all before the dialog lays out and repaints again
+        self.setUpdatesEnabled(False)
+        for i, m in enumerate(milestones):
+            amount = m.get('amount', 0)
+            date_reached = m.get('date_reached', '')
+            time_to_reach = m.get('time_to_reach', '')
+            if i < len(self.milestone_widgets):
+                w = self.milestone_widgets[i]
+                w.amount.setValue(amount)
+                w.date.setText(date_reached)
+                w.time.setText(time_to_reach)
+            else:
+                self._add_milestone_row(amount, date_reached, time_to_reach)
+        for w in self.milestone_widgets[len(milestones):]:
+            self._remove_milestone_row(w)
+        self.setUpdatesEnabled(True)
+        
+        self._content.setEnabled(True)
+        self._save_btn.setEnabled(True)
     
     def _save(self):
         """Save portfolio data."""
@@ -196,12 +322,12 @@ class EditPortfolioDialog(QDialog):
         # Save milestones
         milestones = []
         for w in self.milestone_widgets:
-            amount = w['amount'].value()
+            amount = w.amount.value()
             if amount > 0:
                 milestones.append({
                     'amount': amount,
-                    'date_reached': w['date'].text().strip(),
-                    'time_to_reach': w['time'].text().strip()
+                    'date_reached': w.date.text().strip(),
+                    'time_to_reach': w.time.text().strip()
                 })
         db.save_milestones(milestones)
         
@@ -216,6 +342,9 @@ class PortfolioCard(QWidget):
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._loader = None
+        self._reload_requested = False
+        self._edit_dialog = None
         self.setup_ui()
         self.refresh_data()
     
@@ -226,13 +355,6 @@ class PortfolioCard(QWidget):
         # Main card frame
         self.card = QFrame()
         self.card.setObjectName("card")
-        self.card.setStyleSheet(f"""
-            QFrame#card {{
-                background-color: {COLORS['bg_secondary']};
-                border: 1px solid {COLORS['border']};
-                border-radius: 12px;
-            }}
-        """)
         
         self.card_layout = QVBoxLayout(self.card)
         self.card_layout.setSpacing(16)
@@ -241,128 +363,143 @@ class PortfolioCard(QWidget):
         header_layout = QHBoxLayout()
         
         header = QLabel("Portfolio*")
-        header.setStyleSheet(f"""
-            font-size: 16px;
-            font-weight: 600;
-            color: {COLORS['text_primary']};
-            background-color: {COLORS['bg_card']};
-            padding: 8px 16px;
-            border-radius: 16px;
-        """)
+        header.setObjectName("card_header")
         header.setAlignment(Qt.AlignCenter)
         header.setFixedWidth(120)
         header_layout.addWidget(header)
         header_layout.addStretch()
         
         edit_btn = QPushButton("✏️ Edit")
-        edit_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {COLORS['accent_green_dark']};
-                border: none;
-                border-radius: 6px;
-                font-size: 13px;
-                color: {COLORS['bg_dark']};
-                padding: 6px 12px;
-                font-weight: 600;
-            }}
-            QPushButton:hover {{
-                background-color: {COLORS['accent_green']};
-            }}
-        """)
+        edit_btn.setObjectName("edit_button")
         edit_btn.clicked.connect(self._open_edit_dialog)
         header_layout.addWidget(edit_btn)
         
         self.card_layout.addLayout(header_layout)
         
-        # Content container (will be populated by refresh_data)
+        # Content container (filled in by refresh_data, widgets are reused)
         self.content_widget = QWidget()
         self.content_layout = QVBoxLayout(self.content_widget)
         self.content_layout.setContentsMargins(0, 0, 0, 0)
         self.content_layout.setSpacing(12)
         self.card_layout.addWidget(self.content_widget)
         
+        self._placeholder_label = QLabel("Click ✏️ to add your portfolio information")
+        self._placeholder_label.setObjectName("card_placeholder")
+        self._placeholder_label.setAlignment(Qt.AlignCenter)
+        self.content_layout.addWidget(self._placeholder_label)
+        
+        self._philosophy_label = QLabel()
+        self._philosophy_label.setWordWrap(True)
+        self._philosophy_label.setStyleSheet(_PHILOSOPHY_QSS)
+        self.content_layout.addWidget(self._philosophy_label)
+        
+        # Milestones grid: the started-investing row above a milestones table
+        self._grid = QGridLayout()
+        self._grid.setSpacing(12)
+        for column in range(3):
+            self._grid.setColumnStretch(column, 1)
+        
+        self._started_label = QLabel("Started Investing")
+        self._started_label.setObjectName("card_caption")
+        self._grid.addWidget(self._started_label, 0, 0)
+        
+        self._started_value = QLabel()
+        self._started_value.setStyleSheet(_STARTED_VALUE_QSS)
+        self._grid.addWidget(self._started_value, 0, 1)
+        
+        self._milestones_model = MilestonesModel(self)
+        self._milestones_view = QTableView()
+        self._milestones_view.setModel(self._milestones_model)
+        self._milestones_view.setItemDelegate(_MilestoneDelegate(self._milestones_view))
+        self._milestones_view.setStyleSheet(_MILESTONES_VIEW_QSS)
+        self._milestones_view.setFrameShape(QFrame.NoFrame)
+        self._milestones_view.setShowGrid(False)
+        self._milestones_view.horizontalHeader().setVisible(False)
+        self._milestones_view.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self._milestones_view.verticalHeader().setVisible(False)
+        self._milestones_view.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self._milestones_view.verticalHeader().setDefaultSectionSize(self.fontMetrics().height() + 12)
+        self._milestones_view.setSelectionMode(QAbstractItemView.NoSelection)
+        self._milestones_view.setFocusPolicy(Qt.NoFocus)
+        self._milestones_view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self._milestones_view.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self._grid.addWidget(self._milestones_view, 1, 0, 1, 3)
+        
+        self._grid_widget = QWidget()
+        self._grid_widget.setLayout(self._grid)
+        self.content_layout.addWidget(self._grid_widget)
+        
+        # Footer note
+        self._footer_label = QLabel("*Portfolio includes all activity including options.")
+        self._footer_label.setObjectName("card_footer")
+        self.content_layout.addWidget(self._footer_label)
+        
         self.card_layout.addStretch()
         layout.addWidget(self.card)
     
     def _open_edit_dialog(self):
-        """Open the edit dialog."""
-        dialog = EditPortfolioDialog(self)
-        dialog.saved.connect(self.refresh_data)
-        dialog.saved.connect(self.data_changed.emit)
-        dialog.exec()
+        """Open the edit dialog, built on first use and reloaded on later opens."""
+        if self._edit_dialog is None:
+            self._edit_dialog = EditPortfolioDialog(self)
+            self._edit_dialog.saved.connect(self.refresh_data)
+            self._edit_dialog.saved.connect(self.data_changed.emit)
+        else:
+            self._edit_dialog._load_data()
+        self._edit_dialog.exec()
     
     def refresh_data(self):
-        """Refresh the card with current data."""
-        # Clear existing content
-        while self.content_layout.count():
-            item = self.content_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        """Refresh the card with current data, read on the thread pool."""
+        if self._loader is not None:
+            # A load is already running; reload once it has been applied
+            self._reload_requested = True
+            return
         
-        db = get_database()
-        info = db.get_portfolio_info()
-        milestones = db.get_milestones()
+        self._loader = PortfolioLoader(get_database())
+        self._loader.signals.loaded.connect(self._apply_data)
+        self._loader.signals.failed.connect(self._on_load_failed)
+        QThreadPool.globalInstance().start(self._loader)
+    
+    def _on_load_failed(self, text: str):
+        """Keep showing the last loaded data and let the next refresh try again."""
+        self._loader = None
+        if self._reload_requested:
+            self._reload_requested = False
+            self.refresh_data()
+    
+    def _apply_data(self, info: dict, milestones: list):
+        """Show loaded portfolio info and milestones."""
+        self._loader = None
         
         # Check if there's any data
-        has_data = (
+        has_data = bool(
             info.get('started_investing') or 
             info.get('philosophy') or 
             milestones
         )
         
-        if not has_data:
-            # Show placeholder
-            placeholder = QLabel("Click ✏️ to add your portfolio information")
-            placeholder.setStyleSheet(f"color: {COLORS['text_muted']}; font-style: italic;")
-            placeholder.setAlignment(Qt.AlignCenter)
-            self.content_layout.addWidget(placeholder)
-            return
+        # Update the existing widgets in place and repaint once at the end
+        self.content_widget.setUpdatesEnabled(False)
         
-        # Philosophy text
-        if info.get('philosophy'):
-            philosophy = QLabel(info['philosophy'])
-            philosophy.setWordWrap(True)
-            philosophy.setStyleSheet(f"""
-                color: {COLORS['text_secondary']};
-                font-size: 13px;
-                line-height: 1.5;
-            """)
-            self.content_layout.addWidget(philosophy)
-        
-        # Milestones grid
-        if info.get('started_investing') or milestones:
-            grid = QGridLayout()
-            grid.setSpacing(12)
-            
-            # Started investing header
-            if info.get('started_investing'):
-                started_label = QLabel("Started Investing")
-                started_label.setStyleSheet(f"color: {COLORS['text_secondary']}; font-size: 12px;")
-                grid.addWidget(started_label, 0, 0)
-                
-                started_value = QLabel(info['started_investing'])
-                started_value.setStyleSheet(f"color: {COLORS['text_primary']}; font-size: 12px;")
-                grid.addWidget(started_value, 0, 1)
-            
-            # Milestones
-            for row, m in enumerate(milestones, start=1):
-                amount_label = QLabel(format_currency(m['amount']))
-                amount_label.setStyleSheet(f"color: {COLORS['text_primary']}; font-weight: 500;")
-                grid.addWidget(amount_label, row, 0)
-                
-                date_label = QLabel(m.get('date_reached', ''))
-                date_label.setStyleSheet(f"color: {COLORS['text_secondary']};")
-                grid.addWidget(date_label, row, 1)
-                
-                time_label = QLabel(m.get('time_to_reach', ''))
-                time_label.setStyleSheet(f"color: {COLORS['text_muted']};")
-                grid.addWidget(time_label, row, 2)
-            
-            grid_widget = QWidget()
-            grid_widget.setLayout(grid)
-            self.content_layout.addWidget(grid_widget)
+        self._placeholder_label.setVisible(not has_data)
+        self._footer_label.setVisible(has_data)
         
-        # Footer note
-        footer = QLabel("*Portfolio includes all activity including options.")
-        footer.setStyleSheet(f"color: {COLORS['text_muted']}; font-size: 11px;")
-        self.content_layout.addWidget(footer)
+        philosophy = info.get('philosophy')
+        self._philosophy_label.setText(philosophy or "")
+        self._philosophy_label.setVisible(bool(philosophy))
+        
+        started = info.get('started_investing')
+        self._started_value.setText(started or "")
+        self._started_label.setVisible(bool(started))
+        self._started_value.setVisible(bool(started))
+        
+        self._milestones_model.setMilestones(milestones)
+        self._milestones_view.setFixedHeight(len(milestones) * self._milestones_view.verticalHeader().defaultSectionSize())
+        self._milestones_view.setVisible(bool(milestones))
+        
+        self._grid_widget.setVisible(bool(started or milestones))
+        
+        self.content_widget.setUpdatesEnabled(True)
+        
+        if self._reload_requested:
+            self._reload_requested = False
+            self.refresh_data()
@@ -73,13 +73,6 @@ class PositionsTable(QWidget):
         # Main card frame
         card = QFrame()
         card.setObjectName("card")
-        card.setStyleSheet(f"""
-            QFrame#card {{
-                background-color: {COLORS['bg_secondary']};
-                border: 1px solid {COLORS['border']};
-                border-radius: 12px;
-            }}
-        """)
         
         card_layout = QVBoxLayout(card)
         card_layout.setSpacing(0)
@@ -3,11 +3,17 @@ Premium tracking card component.
 Displays weekly, monthly, YTD premiums and year-end projection.
 """
 
+import calendar
+from datetime import date
+
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame, QGridLayout
 )
 from PySide6.QtCore import Qt
-from ..styles import COLORS, format_currency
+from ..styles import format_currency
+
+
+_MONTH_NAMES = list(calendar.month_name)
 
 
 class PremiumCard(QWidget):
@@ -24,27 +30,13 @@ class PremiumCard(QWidget):
         # Main card frame
         card = QFrame()
         card.setObjectName("card")
-        card.setStyleSheet(f"""
-            QFrame#card {{
-                background-color: {COLORS['bg_secondary']};
-                border: 1px solid {COLORS['border']};
-                border-radius: 12px;
-            }}
-        """)
         
         card_layout = QVBoxLayout(card)
         card_layout.setSpacing(16)
         
         # Header
         header = QLabel("Premiums")
-        header.setStyleSheet(f"""
-            font-size: 16px;
-            font-weight: 600;
-            color: {COLORS['text_primary']};
-            background-color: {COLORS['bg_card']};
-            padding: 8px 16px;
-            border-radius: 16px;
-        """)
+        header.setObjectName("card_header")
         header.setAlignment(Qt.AlignCenter)
         header.setFixedWidth(120)
         
@@ -53,122 +45,120 @@ class PremiumCard(QWidget):
         header_layout.addStretch()
         card_layout.addLayout(header_layout)
         
-        # Current period section
-        self.week_label = self._create_period_row("Week", "$0", "")
-        self.month_label = self._create_period_row("January", "$0", "")
-        self.ytd_label = self._create_period_row("2026 YTD", "$0", "")
-        self.projected_label = self._create_period_row("Year-End Projection:", "$0", "", is_projection=True)
+        # Period rows share one grid: label on the left, value pushed right
+        self._grid = QGridLayout()
+        self._grid.setContentsMargins(0, 0, 0, 0)
+        self._grid.setVerticalSpacing(16)
+        self._grid.setColumnStretch(1, 1)
+        card_layout.addLayout(self._grid)
         
-        card_layout.addLayout(self.week_label['layout'])
-        card_layout.addLayout(self.month_label['layout'])
-        card_layout.addLayout(self.ytd_label['layout'])
-        card_layout.addLayout(self.projected_label['layout'])
+        # Current period section
+        self.week_label = self._add_period_row("Week", "$0")
+        self.month_label = self._add_period_row("January", "$0")
+        self.ytd_label = self._add_period_row("2026 YTD", "$0")
+        self.projected_label = self._add_period_row("Year-End Projection:", "$0", is_projection=True)
         
         # Separator
         separator = QFrame()
         separator.setFixedHeight(1)
-        separator.setStyleSheet(f"background-color: {COLORS['border']};")
-        card_layout.addWidget(separator)
+        separator.setObjectName("card_separator")
+        self._grid.addWidget(separator, self._grid.rowCount(), 0, 1, 2)
         
         # Historical years
         self.year_widgets = {}
         for year in ['2025', '2024', '2023']:
-            row = self._create_period_row(year, "$0", "")
-            card_layout.addLayout(row['layout'])
-            self.year_widgets[year] = row
+            self.year_widgets[year] = self._add_period_row(year, "$0")
         
         card_layout.addStretch()
         layout.addWidget(card)
     
-    def _create_period_row(self, label: str, value: str, avg_dte: str, is_projection: bool = False) -> dict:
-        """Create a row for a time period."""
-        layout = QHBoxLayout()
+    def _add_period_row(self, label: str, value: str, is_projection: bool = False) -> dict:
+        """Add a row for a time period to the period grid."""
+        row = self._grid.rowCount()
         
         label_widget = QLabel(label)
-        label_widget.setStyleSheet(f"""
-            color: {COLORS['text_primary']};
-            font-size: 14px;
-        """)
+        label_widget.setObjectName("period_label")
         
         value_widget = QLabel(value)
-        if is_projection:
-            value_widget.setStyleSheet(f"""
-                color: {COLORS['text_secondary']};
-                font-size: 13px;
-            """)
-        else:
-            value_widget.setStyleSheet(f"""
-                color: {COLORS['accent_green']};
-                font-size: 16px;
-                font-weight: 600;
-            """)
+        value_widget.setObjectName("period_projection" if is_projection else "period_value")
         value_widget.setAlignment(Qt.AlignRight)
         
-        layout.addWidget(label_widget)
-        layout.addStretch()
-        layout.addWidget(value_widget)
+        self._grid.addWidget(label_widget, row, 0, Qt.AlignLeft)
+        self._grid.addWidget(value_widget, row, 1, Qt.AlignRight)
         
-        return {'layout': layout, 'label': label_widget, 'value': value_widget}
+        return {'label': label_widget, 'value': value_widget, 'dim': False}
+    
+    def _set_value_dim(self, row: dict, dim: bool):
+        """Switch a row value between the highlighted and dimmed style."""
+        if row['dim'] != dim:
+            value = row['value']
+            value.setProperty("dim", dim)
+            style = value.style()
+            style.unpolish(value)
+            style.polish(value)
+            row['dim'] = dim
+    
+    def _set_row_text(self, row: dict, key: str, text: str):
+        """Set a row's label or value text only when it differs from the last one."""
+        last_key = f'{key}_text'
+        if row.get(last_key) != text:
+            row[key].setText(text)
+            row[last_key] = text
+    
+    def _set_row_visible(self, row: dict, visible: bool):
+        """Show or hide a row only when its visibility changes."""
+        if row.get('visible') != visible:
+            row['label'].setVisible(visible)
+            row['value'].setVisible(visible)
+            row['visible'] = visible
     
     def update_data(self, data: dict):
         """Update the premium data display."""
-        from datetime import date
-        import calendar
-        
         today = date.today()
-        month_name = calendar.month_name[today.month]
+        month_name = _MONTH_NAMES[today.month]
         
         # Get week number from data (based on first trade date)
         week_num = data.get('week_number', 0)
         first_trade = data.get('first_trade_date')
         
-        # Update current periods
+        # Update current periods; unchanged text is not pushed to the labels
         if week_num > 0:
-            self.week_label['label'].setText(f"Week {week_num}")
-            self.week_label['value'].setText(format_currency(data.get('week', 0)))
-            self.week_label['value'].setStyleSheet(
-                f"color: {COLORS['accent_green']}; font-size: 16px; font-weight: 600;"
-            )
+            self._set_row_text(self.week_label, 'label', f"Week {week_num}")
+            self._set_row_text(self.week_label, 'value', format_currency(data.get('week', 0)))
+            self._set_value_dim(self.week_label, False)
         else:
-            self.week_label['label'].setText("Week 1")
-            self.week_label['value'].setText("—")
-            self.week_label['value'].setStyleSheet(f"color: {COLORS['text_secondary']}; font-size: 16px;")
+            self._set_row_text(self.week_label, 'label', "Week 1")
+            self._set_row_text(self.week_label, 'value', "—")
+            self._set_value_dim(self.week_label, True)
         
-        self.month_label['label'].setText(month_name)
+        self._set_row_text(self.month_label, 'label', month_name)
         if data.get('month', 0) > 0 or week_num > 0:
-            self.month_label['value'].setText(format_currency(data.get('month', 0)))
-            self.month_label['value'].setStyleSheet(
-                f"color: {COLORS['accent_green']}; font-size: 16px; font-weight: 600;"
-            )
+            self._set_row_text(self.month_label, 'value', format_currency(data.get('month', 0)))
+            self._set_value_dim(self.month_label, False)
         else:
-            self.month_label['value'].setText("—")
-            self.month_label['value'].setStyleSheet(f"color: {COLORS['text_secondary']}; font-size: 16px;")
+            self._set_row_text(self.month_label, 'value', "—")
+            self._set_value_dim(self.month_label, True)
         
         # Use first trade year for YTD label
         display_year = first_trade.year if first_trade else today.year
-        self.ytd_label['label'].setText(f"{display_year} YTD")
+        self._set_row_text(self.ytd_label, 'label', f"{display_year} YTD")
         if data.get('ytd', 0) > 0 or week_num > 0:
-            self.ytd_label['value'].setText(format_currency(data.get('ytd', 0)))
-            self.ytd_label['value'].setStyleSheet(
-                f"color: {COLORS['accent_green']}; font-size: 16px; font-weight: 600;"
-            )
+            self._set_row_text(self.ytd_label, 'value', format_currency(data.get('ytd', 0)))
+            self._set_value_dim(self.ytd_label, False)
         else:
-            self.ytd_label['value'].setText("—")
-            self.ytd_label['value'].setStyleSheet(f"color: {COLORS['text_secondary']}; font-size: 16px;")
+            self._set_row_text(self.ytd_label, 'value', "—")
+            self._set_value_dim(self.ytd_label, True)
         
         if data.get('projected', 0) > 0:
-            self.projected_label['value'].setText(f"Year-End Projection: {format_currency(data.get('projected', 0))}")
+            projection = f"Year-End Projection: {format_currency(data.get('projected', 0))}"
         else:
-            self.projected_label['value'].setText("Year-End Projection: —")
+            projection = "Year-End Projection: —"
+        self._set_row_text(self.projected_label, 'value', projection)
         
         # Update historical years (hide if no data)
         yearly = data.get('yearly', {})
         for year, widget in self.year_widgets.items():
             amount = yearly.get(year, 0)
             if amount > 0:
-                widget['value'].setText(format_currency(amount))
-                widget['label'].setVisible(True)
-                widget['value'].setVisible(True)
-            else:
-                widget['label'].setVisible(False)
-                widget['value'].setVisible(False)
+                self._set_row_text(widget, 'value', format_currency(amount))
+            self._set_row_visible(widget, amount > 0)
@@ -126,6 +126,16 @@ class SettingsPage(QWidget):
                 padding: 0 12px;
                 background-color: {COLORS['bg_secondary']};
             }}
+            QLabel#tier_name {{
+                color: {COLORS['text_primary']};
+                font-weight: 600;
+            }}
+            QLabel#tier_features {{
+                color: {COLORS['text_secondary']};
+            }}
+            QLabel#tier_price {{
+                color: {COLORS['accent_green']};
+            }}
         """)
         
         tier_layout = QVBoxLayout(tier_info)
@@ -144,17 +154,17 @@ class SettingsPage(QWidget):
             
             name_label = QLabel(name)
             name_label.setFixedWidth(100)
-            name_label.setStyleSheet(f"color: {COLORS['text_primary']}; font-weight: 600;")
+            name_label.setObjectName("tier_name")
             row.addWidget(name_label)
             
             features_label = QLabel(features)
-            features_label.setStyleSheet(f"color: {COLORS['text_secondary']};")
+            features_label.setObjectName("tier_features")
             row.addWidget(features_label, 1)
             
             price_label = QLabel(price)
             price_label.setFixedWidth(100)
             price_label.setAlignment(Qt.AlignRight)
-            price_label.setStyleSheet(f"color: {COLORS['accent_green']};")
+            price_label.setObjectName("tier_price")
             row.addWidget(price_label)
             
             tier_layout.addLayout(row)
@@ -3,30 +3,163 @@ Trade entry dialog component.
 Allows manual entry of CSPs, covered calls, assignments, and closures.
 """
 
+from functools import partial, wraps
+
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QComboBox,
-    QDoubleSpinBox, QSpinBox, QDateEdit, QTextEdit, QPushButton,
-    QFormLayout, QFrame, QMessageBox, QTabWidget, QWidget
+    QDoubleSpinBox, QSpinBox, QDateEdit, QPlainTextEdit, QPushButton,
+    QGridLayout, QFrame, QMessageBox, QTabWidget, QWidget
 )
-from PySide6.QtCore import Qt, QDate, Signal
+from PySide6.QtCore import Qt, QDate, Signal, QObject, QRunnable, QThreadPool
 from ..styles import COLORS
 from ..lib.database import get_database
 
 
+# The whole dialog is styled from one stylesheet, formatted once at import,
+# with its widgets picked out by object name
+_DIALOG_QSS = f"""
+    QDialog {{
+        background-color: {COLORS['bg_primary']};
+    }}
+    QLabel#trade_title {{
+        font-size: 20px;
+        font-weight: 600;
+        color: {COLORS['text_primary']};
+    }}
+    QLabel#trade_info {{
+        color: {COLORS['text_secondary']};
+    }}
+    QTabWidget#trade_tabs::pane {{
+        border: 1px solid {COLORS['border']};
+        border-radius: 8px;
+        background-color: {COLORS['bg_secondary']};
+    }}
+    QTabWidget#trade_tabs QTabBar::tab {{
+        background-color: {COLORS['bg_secondary']};
+        color: {COLORS['text_secondary']};
+        padding: 10px 20px;
+        border: none;
+        border-top-left-radius: 8px;
+        border-top-right-radius: 8px;
+    }}
+    QTabWidget#trade_tabs QTabBar::tab:selected {{
+        background-color: {COLORS['bg_card']};
+        color: {COLORS['text_primary']};
+    }}
+    QPushButton#primary {{
+        color: {COLORS['text_primary']};
+    }}
+"""
+
+
+# Fields of the CSP and CC forms: attribute suffix, row label, widget class and
+# the setter calls that configure it. Expiration date and delta range are set
+# per form.
+_OPTION_FIELDS = (
+    ('ticker', "Ticker:", QLineEdit, (
+        ('setPlaceholderText', ("e.g., AAPL",)),
+        ('setMaxLength', (10,)),
+    )),
+    ('strike', "Strike Price:", QDoubleSpinBox, (
+        ('setRange', (0, 100000)),
+        ('setDecimals', (2,)),
+        ('setPrefix', ("$",)),
+    )),
+    ('expiration', "Expiration:", QDateEdit, (
+        ('setCalendarPopup', (True,)),
+    )),
+    ('premium', "Premium (per share):", QDoubleSpinBox, (
+        ('setRange', (0, 10000)),
+        ('setDecimals', (2,)),
+        ('setPrefix', ("$",)),
+        ('setSingleStep', (0.01,)),
+    )),
+    ('quantity', "Contracts:", QSpinBox, (
+        ('setRange', (1, 1000)),
+        ('setValue', (1,)),
+    )),
+    ('delta', "Delta (optional):", QDoubleSpinBox, (
+        ('setDecimals', (2,)),
+        ('setSingleStep', (0.01,)),
+    )),
+    ('notes', "Notes:", QPlainTextEdit, (
+        ('setMaximumHeight', (60,)),
+        ('setPlaceholderText', ("Optional notes...",)),
+    )),
+)
+
+
+def _action_button(text: str, object_name: str, on_click) -> QPushButton:
+    """Create a named, pointing-hand push button connected to its click handler."""
+    button = QPushButton(text)
+    button.setObjectName(object_name)
+    button.setCursor(Qt.PointingHandCursor)
+    button.clicked.connect(on_click)
+    return button
+
+
+def _single_submit(handler):
+    """Disable the clicked submit button while its handler runs."""
+    # Clicks queued behind a message box would otherwise submit the form again;
+    # the button comes back afterwards because the dialog is reused
+    @wraps(handler)
+    def wrapper(self):
+        button = self.sender()
+        if isinstance(button, QPushButton):
+            button.setEnabled(False)
+        try:
+            handler(self)
+        finally:
+            if isinstance(button, QPushButton):
+                button.setEnabled(True)
+    return wrapper
+
+
+class _TradeWriterSignals(QObject):
+    finished = Signal(str)
+    failed = Signal(str)
+
+
+class TradeWriter(QRunnable):
+    """Runs a trade database write on a thread pool thread."""
+    
+    def __init__(self, db, write, success_text: str, error_text: str):
+        super().__init__()
+        self.db = db
+        self.write = write
+        self.success_text = success_text
+        self.error_text = error_text
+        self.signals = _TradeWriterSignals()
+    
+    def run(self):
+        try:
+            self.write()
+        except Exception as e:
+            self.signals.failed.emit(f"{self.error_text}: {e}")
+        else:
+            self.signals.finished.emit(self.success_text)
+        finally:
+            self.db.release_thread_connections()
+
+
 class TradeEntryDialog(QDialog):
     """Dialog for entering new trades."""
     
     trade_added = Signal()
     
+    # Tab order: labels and the tab index of each trade type
+    _TAB_LABELS = ("Cash-Secured Put", "Covered Call", "Assignment", "Close/Roll")
+    _TYPE_TO_INDEX = {'CSP': 0, 'CC': 1, 'ASSIGNMENT': 2, 'CLOSE': 3}
+    
     def __init__(self, parent=None, trade_type: str = None):
         super().__init__(parent)
         self.setWindowTitle("Add Trade")
         self.setMinimumWidth(450)
-        self.setStyleSheet(f"""
-            QDialog {{
-                background-color: {COLORS['bg_primary']};
-            }}
-        """)
+        self.setStyleSheet(_DIALOG_QSS)
+        self._db = None
+        self._warn_box = None
+        self._err_box = None
+        self._writer = None
         self.setup_ui(trade_type)
     
     def setup_ui(self, initial_type: str = None):
@@ -35,283 +168,268 @@ class TradeEntryDialog(QDialog):
         
         # Title
         title = QLabel("Add New Trade")
-        title.setStyleSheet(f"""
-            font-size: 20px;
-            font-weight: 600;
-            color: {COLORS['text_primary']};
-        """)
+        title.setObjectName("trade_title")
         layout.addWidget(title)
         
         # Tab widget for trade types
         self.tabs = QTabWidget()
-        self.tabs.setStyleSheet(f"""
-            QTabWidget::pane {{
-                border: 1px solid {COLORS['border']};
-                border-radius: 8px;
-                background-color: {COLORS['bg_secondary']};
-            }}
-            QTabBar::tab {{
-                background-color: {COLORS['bg_secondary']};
-                color: {COLORS['text_secondary']};
-                padding: 10px 20px;
-                border: none;
-                border-top-left-radius: 8px;
-                border-top-right-radius: 8px;
-            }}
-            QTabBar::tab:selected {{
-                background-color: {COLORS['bg_card']};
-                color: {COLORS['text_primary']};
-            }}
-        """)
-        
-        # Create tabs for each trade type
-        self._create_csp_tab()
-        self._create_cc_tab()
-        self._create_assignment_tab()
-        self._create_close_tab()
+        self.tabs.setObjectName("trade_tabs")
+        
+        # Default expiration shared by the option forms
+        self._default_expiration = QDate.currentDate().addDays(30)
+        
+        # One empty page per trade type; each form is built the first time
+        # its tab is shown
+        self._tab_builders = [
+            self._create_csp_tab,
+            self._create_cc_tab,
+            self._create_assignment_tab,
+            self._create_close_tab,
+        ]
+        self._built = [False] * len(self._tab_builders)
+        self._forms = {}
+        for label in self._TAB_LABELS:
+            page = QWidget()
+            page_layout = QVBoxLayout(page)
+            page_layout.setContentsMargins(0, 0, 0, 0)
+            self.tabs.addTab(page, label)
         
         layout.addWidget(self.tabs)
         
         # Set initial tab if specified
-        if initial_type:
-            type_to_index = {'CSP': 0, 'CC': 1, 'ASSIGNMENT': 2, 'CLOSE': 3}
-            self.tabs.setCurrentIndex(type_to_index.get(initial_type, 0))
+        self.select_trade_type(initial_type)
+        
+        self._ensure_built(self.tabs.currentIndex())
+        self.tabs.currentChanged.connect(self._ensure_built)
+    
+    @property
+    def db(self):
+        """Database for this opening of the dialog, looked up on first use."""
+        if self._db is None:
+            self._db = get_database()
+        return self._db
+    
+    def _show_warning(self, text: str):
+        """Show a validation warning in the dialog's reusable warning box."""
+        if self._warn_box is None:
+            self._warn_box = QMessageBox(QMessageBox.Warning, "Error", "", QMessageBox.Ok, self)
+        self._warn_box.setText(text)
+        self._warn_box.exec()
+    
+    def _show_error(self, text: str):
+        """Show a failure in the dialog's reusable error box."""
+        if self._err_box is None:
+            self._err_box = QMessageBox(QMessageBox.Critical, "Error", "", QMessageBox.Ok, self)
+        self._err_box.setText(text)
+        self._err_box.exec()
+    
+    def select_trade_type(self, trade_type: str = None):
+        """Show the tab for a trade type, or the first tab if none is given."""
+        self.tabs.setCurrentIndex(self._TYPE_TO_INDEX.get(trade_type, 0))
+    
+    def reset(self):
+        """Return every built form to its initial values so the dialog can be reused."""
+        # Demo mode may have been toggled since the last opening
+        self._db = None
+        self._default_expiration = QDate.currentDate().addDays(30)
+        expiration = self._default_expiration
+        
+        if self._built[0]:
+            self.csp_ticker.clear()
+            self.csp_strike.setValue(0)
+            self.csp_expiration.setDate(expiration)
+            self.csp_premium.setValue(0)
+            self.csp_quantity.setValue(1)
+            self.csp_delta.setValue(-0.15)
+            self.csp_notes.clear()
+        
+        if self._built[1]:
+            self.cc_ticker.clear()
+            self.cc_strike.setValue(0)
+            self.cc_expiration.setDate(expiration)
+            self.cc_premium.setValue(0)
+            self.cc_quantity.setValue(1)
+            self.cc_delta.setValue(0.15)
+            self.cc_notes.clear()
+        
+        if self._built[2]:
+            self.assign_ticker.clear()
+            self.assign_shares.setValue(100)
+            self.assign_cost.setValue(0)
+            self.assign_type.setCurrentIndex(0)
+            self.assign_notes.clear()
+        
+        if self._built[3]:
+            self.close_trade_id.setValue(self.close_trade_id.minimum())
+            self.close_status.setCurrentIndex(0)
     
-    def _create_form_widget(self) -> tuple[QWidget, QFormLayout]:
-        """Create a form widget with layout."""
+    def _ensure_built(self, index: int):
+        """Build the form of a tab the first time it is shown."""
+        if index < 0 or self._built[index]:
+            return
+        self._built[index] = True
+        widget = self._tab_builders[index]()
+        self.tabs.widget(index).layout().addWidget(widget)
+        widget.setUpdatesEnabled(True)
+    
+    def _create_form_widget(self, rows: list) -> QWidget:
+        """Create a form widget laying out (label, field) rows in one pass."""
+        # Updates stay off until the form is added to its tab
         widget = QWidget()
-        form = QFormLayout(widget)
-        form.setSpacing(12)
-        form.setContentsMargins(16, 16, 16, 16)
-        return widget, form
+        widget.setUpdatesEnabled(False)
+        grid = QGridLayout(widget)
+        grid.setSpacing(12)
+        grid.setContentsMargins(16, 16, 16, 16)
+        grid.setColumnStretch(1, 1)
+        
+        for row, (label, field) in enumerate(rows):
+            if label is None:
+                # Unlabelled rows span both columns
+                grid.addWidget(field, row, 0, 1, 2)
+                continue
+            if label:
+                # Labels of multi-line fields stay level with the first line
+                alignment = Qt.AlignTop if isinstance(field, QPlainTextEdit) else Qt.Alignment()
+                grid.addWidget(QLabel(label), row, 0, alignment)
+            grid.addWidget(field, row, 1)
+        
+        # Rows keep their natural height, leftover space goes below the form
+        grid.setRowStretch(len(rows), 1)
+        return widget
     
-    def _create_csp_tab(self):
-        """Create Cash-Secured Put entry form."""
-        widget, form = self._create_form_widget()
-        
-        # Ticker
-        self.csp_ticker = QLineEdit()
-        self.csp_ticker.setPlaceholderText("e.g., AAPL")
-        self.csp_ticker.setMaxLength(10)
-        form.addRow("Ticker:", self.csp_ticker)
-        
-        # Strike
-        self.csp_strike = QDoubleSpinBox()
-        self.csp_strike.setRange(0, 100000)
-        self.csp_strike.setDecimals(2)
-        self.csp_strike.setPrefix("$")
-        form.addRow("Strike Price:", self.csp_strike)
-        
-        # Expiration
-        self.csp_expiration = QDateEdit()
-        self.csp_expiration.setDate(QDate.currentDate().addDays(30))
-        self.csp_expiration.setCalendarPopup(True)
-        form.addRow("Expiration:", self.csp_expiration)
-        
-        # Premium
-        self.csp_premium = QDoubleSpinBox()
-        self.csp_premium.setRange(0, 10000)
-        self.csp_premium.setDecimals(2)
-        self.csp_premium.setPrefix("$")
-        self.csp_premium.setSingleStep(0.01)
-        form.addRow("Premium (per share):", self.csp_premium)
-        
-        # Quantity
-        self.csp_quantity = QSpinBox()
-        self.csp_quantity.setRange(1, 1000)
-        self.csp_quantity.setValue(1)
-        form.addRow("Contracts:", self.csp_quantity)
-        
-        # Delta
-        self.csp_delta = QDoubleSpinBox()
-        self.csp_delta.setRange(-1, 0)
-        self.csp_delta.setDecimals(2)
-        self.csp_delta.setSingleStep(0.01)
-        self.csp_delta.setValue(-0.15)
-        form.addRow("Delta (optional):", self.csp_delta)
-        
-        # Notes
-        self.csp_notes = QTextEdit()
-        self.csp_notes.setMaximumHeight(60)
-        self.csp_notes.setPlaceholderText("Optional notes...")
-        form.addRow("Notes:", self.csp_notes)
+    def _build_option_tab(self, prefix: str, delta_range: tuple, delta_default: float,
+                          button_text: str, trade_type: str, on_submit) -> QWidget:
+        """Create an option trade entry form from the shared field specs."""
+        fields = {}
+        rows = []
+        for name, label, widget_cls, setters in _OPTION_FIELDS:
+            field = widget_cls()
+            for setter, args in setters:
+                getattr(field, setter)(*args)
+            setattr(self, f"{prefix}_{name}", field)
+            fields[name] = field
+            rows.append((label, field))
+        self._forms[trade_type] = fields
+        
+        fields['expiration'].setDate(self._default_expiration)
+        fields['delta'].setRange(*delta_range)
+        fields['delta'].setValue(delta_default)
         
         # Submit button
-        submit_btn = QPushButton("Add CSP Trade")
-        submit_btn.setObjectName("primary")
-        submit_btn.setStyleSheet(f"color: {COLORS['text_primary']};")
-        submit_btn.setCursor(Qt.PointingHandCursor)
-        submit_btn.clicked.connect(lambda: self._submit_trade('CSP'))
-        form.addRow("", submit_btn)
+        submit_btn = _action_button(button_text, "primary", on_submit)
+        rows.append(("", submit_btn))
         
-        self.tabs.addTab(widget, "Cash-Secured Put")
+        return self._create_form_widget(rows)
+    
+    def _create_csp_tab(self) -> QWidget:
+        """Create Cash-Secured Put entry form."""
+        return self._build_option_tab('csp', (-1, 0), -0.15, "Add CSP Trade", 'CSP', self._submit_csp)
     
-    def _create_cc_tab(self):
+    def _create_cc_tab(self) -> QWidget:
         """Create Covered Call entry form."""
-        widget, form = self._create_form_widget()
-        
-        # Ticker
-        self.cc_ticker = QLineEdit()
-        self.cc_ticker.setPlaceholderText("e.g., AAPL")
-        self.cc_ticker.setMaxLength(10)
-        form.addRow("Ticker:", self.cc_ticker)
-        
-        # Strike
-        self.cc_strike = QDoubleSpinBox()
-        self.cc_strike.setRange(0, 100000)
-        self.cc_strike.setDecimals(2)
-        self.cc_strike.setPrefix("$")
-        form.addRow("Strike Price:", self.cc_strike)
-        
-        # Expiration
-        self.cc_expiration = QDateEdit()
-        self.cc_expiration.setDate(QDate.currentDate().addDays(30))
-        self.cc_expiration.setCalendarPopup(True)
-        form.addRow("Expiration:", self.cc_expiration)
-        
-        # Premium
-        self.cc_premium = QDoubleSpinBox()
-        self.cc_premium.setRange(0, 10000)
-        self.cc_premium.setDecimals(2)
-        self.cc_premium.setPrefix("$")
-        self.cc_premium.setSingleStep(0.01)
-        form.addRow("Premium (per share):", self.cc_premium)
-        
-        # Quantity
-        self.cc_quantity = QSpinBox()
-        self.cc_quantity.setRange(1, 1000)
-        self.cc_quantity.setValue(1)
-        form.addRow("Contracts:", self.cc_quantity)
-        
-        # Delta
-        self.cc_delta = QDoubleSpinBox()
-        self.cc_delta.setRange(0, 1)
-        self.cc_delta.setDecimals(2)
-        self.cc_delta.setSingleStep(0.01)
-        self.cc_delta.setValue(0.15)
-        form.addRow("Delta (optional):", self.cc_delta)
-        
-        # Notes
-        self.cc_notes = QTextEdit()
-        self.cc_notes.setMaximumHeight(60)
-        self.cc_notes.setPlaceholderText("Optional notes...")
-        form.addRow("Notes:", self.cc_notes)
-        
-        # Submit button
-        submit_btn = QPushButton("Add Covered Call")
-        submit_btn.setObjectName("primary")
-        submit_btn.setStyleSheet(f"color: {COLORS['text_primary']};")
-        submit_btn.setCursor(Qt.PointingHandCursor)
-        submit_btn.clicked.connect(lambda: self._submit_trade('CC'))
-        form.addRow("", submit_btn)
-        
-        self.tabs.addTab(widget, "Covered Call")
+        return self._build_option_tab('cc', (0, 1), 0.15, "Add Covered Call", 'CC', self._submit_cc)
     
-    def _create_assignment_tab(self):
+    def _create_assignment_tab(self) -> QWidget:
         """Create Assignment entry form."""
-        widget, form = self._create_form_widget()
+        rows = []
         
         # Ticker
         self.assign_ticker = QLineEdit()
         self.assign_ticker.setPlaceholderText("e.g., AAPL")
         self.assign_ticker.setMaxLength(10)
-        form.addRow("Ticker:", self.assign_ticker)
+        rows.append(("Ticker:", self.assign_ticker))
         
         # Shares
         self.assign_shares = QSpinBox()
         self.assign_shares.setRange(1, 100000)
         self.assign_shares.setValue(100)
         self.assign_shares.setSingleStep(100)
-        form.addRow("Shares:", self.assign_shares)
+        rows.append(("Shares:", self.assign_shares))
         
         # Cost basis (strike price at assignment)
         self.assign_cost = QDoubleSpinBox()
         self.assign_cost.setRange(0, 100000)
         self.assign_cost.setDecimals(2)
         self.assign_cost.setPrefix("$")
-        form.addRow("Cost Basis (per share):", self.assign_cost)
+        rows.append(("Cost Basis (per share):", self.assign_cost))
         
         # Assignment type
         self.assign_type = QComboBox()
         self.assign_type.addItems(["PUT Assignment (bought shares)", "CALL Assignment (sold shares)"])
-        form.addRow("Type:", self.assign_type)
+        rows.append(("Type:", self.assign_type))
         
         # Notes
-        self.assign_notes = QTextEdit()
+        self.assign_notes = QPlainTextEdit()
         self.assign_notes.setMaximumHeight(60)
         self.assign_notes.setPlaceholderText("Optional notes...")
-        form.addRow("Notes:", self.assign_notes)
+        rows.append(("Notes:", self.assign_notes))
         
         # Submit button
-        submit_btn = QPushButton("Record Assignment")
-        submit_btn.setObjectName("primary")
-        submit_btn.setStyleSheet(f"color: {COLORS['text_primary']};")
-        submit_btn.setCursor(Qt.PointingHandCursor)
-        submit_btn.clicked.connect(self._submit_assignment)
-        form.addRow("", submit_btn)
+        submit_btn = _action_button("Record Assignment", "primary", self._submit_assignment)
+        rows.append(("", submit_btn))
         
-        self.tabs.addTab(widget, "Assignment")
+        return self._create_form_widget(rows)
     
-    def _create_close_tab(self):
+    def _create_close_tab(self) -> QWidget:
         """Create Close/Roll position form."""
-        widget, form = self._create_form_widget()
+        rows = []
         
         info = QLabel("Select an open trade from the positions table and use this to close or roll it.")
         info.setWordWrap(True)
-        info.setStyleSheet(f"color: {COLORS['text_secondary']};")
-        form.addRow(info)
+        info.setObjectName("trade_info")
+        rows.append((None, info))
         
         # Trade ID (would be populated from selection)
         self.close_trade_id = QSpinBox()
         self.close_trade_id.setRange(1, 999999)
-        form.addRow("Trade ID:", self.close_trade_id)
+        rows.append(("Trade ID:", self.close_trade_id))
         
         # Status
         self.close_status = QComboBox()
         self.close_status.addItems(["CLOSED", "EXPIRED", "ASSIGNED"])
-        form.addRow("Status:", self.close_status)
+        rows.append(("Status:", self.close_status))
         
         # Submit button
-        submit_btn = QPushButton("Close Trade")
-        submit_btn.setObjectName("primary")
-        submit_btn.setStyleSheet(f"color: {COLORS['text_primary']};")
-        submit_btn.setCursor(Qt.PointingHandCursor)
-        submit_btn.clicked.connect(self._submit_close)
-        form.addRow("", submit_btn)
+        submit_btn = _action_button("Close Trade", "primary", self._submit_close)
+        rows.append(("", submit_btn))
         
-        self.tabs.addTab(widget, "Close/Roll")
+        return self._create_form_widget(rows)
+    
+    @_single_submit
+    def _submit_csp(self):
+        """Submit the CSP form."""
+        self._submit_trade('CSP')
+    
+    @_single_submit
+    def _submit_cc(self):
+        """Submit the CC form."""
+        self._submit_trade('CC')
     
     def _submit_trade(self, trade_type: str):
         """Submit a CSP or CC trade."""
-        db = get_database()
-        
-        if trade_type == 'CSP':
-            ticker = self.csp_ticker.text().strip().upper()
-            strike = self.csp_strike.value()
-            expiration = self.csp_expiration.date().toString("yyyy-MM-dd")
-            premium = self.csp_premium.value()
-            quantity = self.csp_quantity.value()
-            delta = self.csp_delta.value()
-            notes = self.csp_notes.toPlainText().strip()
-        else:  # CC
-            ticker = self.cc_ticker.text().strip().upper()
-            strike = self.cc_strike.value()
-            expiration = self.cc_expiration.date().toString("yyyy-MM-dd")
-            premium = self.cc_premium.value()
-            quantity = self.cc_quantity.value()
-            delta = self.cc_delta.value()
-            notes = self.cc_notes.toPlainText().strip()
-        
+        # Validate the required fields before reading the rest of the form
+        f = self._forms[trade_type]
+        ticker = f['ticker'].text().strip().upper()
         if not ticker:
-            QMessageBox.warning(self, "Error", "Please enter a ticker symbol.")
+            self._show_warning("Please enter a ticker symbol.")
             return
         
+        premium = f['premium'].value()
         if premium <= 0:
-            QMessageBox.warning(self, "Error", "Please enter a premium amount.")
+            self._show_warning("Please enter a premium amount.")
             return
         
-        try:
-            db.create_trade(
+        db = self.db
+        strike = f['strike'].value()
+        expiry = f['expiration'].date()
+        expiration = f"{expiry.year():04d}-{expiry.month():02d}-{expiry.day():02d}"
+        quantity = f['quantity'].value()
+        delta = f['delta'].value()
+        notes = f['notes'].toPlainText().strip()
+        
+        self._start_write(
+            partial(
+                db.create_trade,
                 ticker=ticker,
                 trade_type=trade_type,
                 strike=strike,
@@ -320,79 +438,104 @@ class TradeEntryDialog(QDialog):
                 quantity=quantity,
                 delta=delta if delta != 0 else None,
                 notes=notes if notes else None
-            )
-            
-            self.trade_added.emit()
-            QMessageBox.information(self, "Success", f"{trade_type} trade added successfully!")
-            self.accept()
-            
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to add trade: {str(e)}")
+            ),
+            f"{trade_type} trade added successfully!",
+            "Failed to add trade"
+        )
     
+    @_single_submit
     def _submit_assignment(self):
         """Submit an assignment."""
-        db = get_database()
-        
         ticker = self.assign_ticker.text().strip().upper()
+        if not ticker:
+            self._show_warning("Please enter a ticker symbol.")
+            return
+        
+        db = self.db
         shares = self.assign_shares.value()
         cost = self.assign_cost.value()
         is_put = self.assign_type.currentIndex() == 0
         notes = self.assign_notes.toPlainText().strip()
         
-        if not ticker:
-            QMessageBox.warning(self, "Error", "Please enter a ticker symbol.")
-            return
-        
-        try:
-            # Get or create position
-            position = db.get_or_create_position(ticker)
-            
-            if is_put:
-                # PUT assignment - we bought shares
-                new_shares = position.get('shares_owned', 0) + shares
-                # Calculate new cost basis
-                old_cost = position.get('cost_basis', 0) * position.get('shares_owned', 0)
-                new_cost = old_cost + (cost * shares)
-                avg_cost = new_cost / new_shares if new_shares > 0 else cost
+        def record():
+            # Position update and assignment trade are committed together
+            with db.transaction():
+                position = db.get_or_create_position(ticker)
                 
-                db.update_position(position['id'], shares=new_shares, cost_basis=avg_cost)
-            else:
-                # CALL assignment - we sold shares
-                new_shares = max(0, position.get('shares_owned', 0) - shares)
-                db.update_position(position['id'], shares=new_shares)
-            
-            # Record the assignment as a trade
-            db.create_trade(
-                ticker=ticker,
-                trade_type='ASSIGNMENT',
-                strike=cost,
-                premium=0,
-                quantity=shares // 100,
-                notes=notes if notes else None
-            )
-            
-            self.trade_added.emit()
-            QMessageBox.information(self, "Success", "Assignment recorded successfully!")
-            self.accept()
-            
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to record assignment: {str(e)}")
+                if is_put:
+                    # PUT assignment - we bought shares
+                    new_shares = position.get('shares_owned', 0) + shares
+                    # Calculate new cost basis
+                    old_cost = position.get('cost_basis', 0) * position.get('shares_owned', 0)
+                    new_cost = old_cost + (cost * shares)
+                    avg_cost = new_cost / new_shares if new_shares > 0 else cost
+                    
+                    db.update_position(position['id'], shares=new_shares, cost_basis=avg_cost)
+                else:
+                    # CALL assignment - we sold shares
+                    new_shares = max(0, position.get('shares_owned', 0) - shares)
+                    db.update_position(position['id'], shares=new_shares)
+                
+                # Record the assignment as a trade
+                db.create_trade(
+                    ticker=ticker,
+                    trade_type='ASSIGNMENT',
+                    strike=cost,
+                    premium=0,
+                    quantity=shares // 100,
+                    notes=notes if notes else None
+                )
+        
+        self._start_write(record, "Assignment recorded successfully!", "Failed to record assignment")
     
+    @_single_submit
     def _submit_close(self):
         """Close a trade."""
-        db = get_database()
+        db = self.db
         
         trade_id = self.close_trade_id.value()
         status = self.close_status.currentText()
         
-        try:
-            db.close_trade(trade_id, status)
-            self.trade_added.emit()
-            QMessageBox.information(self, "Success", "Trade closed successfully!")
+        self._start_write(
+            partial(db.close_trade, trade_id, status),
+            "Trade closed successfully!",
+            "Failed to close trade"
+        )
+    
+    def reject(self):
+        """Keep the dialog open while a write is still running."""
+        if self._writer is None:
+            super().reject()
+    
+    def closeEvent(self, event):
+        """Ignore window close requests while a write is still running."""
+        if self._writer is not None:
+            event.ignore()
+        else:
+            super().closeEvent(event)
+    
+    def _start_write(self, write, success_text: str, error_text: str):
+        """Run a database write on the thread pool, locking the forms until it is done."""
+        self.tabs.setEnabled(False)
+        self._writer = TradeWriter(self.db, write, success_text, error_text)
+        self._writer.signals.finished.connect(self._on_write_finished)
+        self._writer.signals.failed.connect(self._on_write_failed)
+        QThreadPool.globalInstance().start(self._writer)
+    
+    def _on_write_finished(self, text: str):
+        """Report a saved trade and close the dialog."""
+        self._writer = None
+        self.tabs.setEnabled(True)
+        self.trade_added.emit()
+        if self.isVisible():
+            QMessageBox.information(self, "Success", text)
             self.accept()
-            
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to close trade: {str(e)}")
+    
+    def _on_write_failed(self, text: str):
+        """Report a failed write and leave the form open for another try."""
+        self._writer = None
+        self.tabs.setEnabled(True)
+        self._show_error(text)
 
 
 class QuickTradeButtons(QWidget):
@@ -402,6 +545,7 @@ class QuickTradeButtons(QWidget):
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._dialog = None
         self.setup_ui()
     
     def setup_ui(self):
@@ -410,66 +554,37 @@ class QuickTradeButtons(QWidget):
         layout.setSpacing(8)
         
         # Add CSP button
-        csp_btn = QPushButton("+ CSP")
-        csp_btn.setObjectName("primary")
-        csp_btn.setCursor(Qt.PointingHandCursor)
-        csp_btn.setStyleSheet(f"""
-            QPushButton#primary {{
-                background-color: {COLORS['accent_green_dark']};
-                border: none;
-                color: {COLORS['bg_dark']};
-                font-weight: 600;
-                padding: 10px 20px;
-                border-radius: 6px;
-            }}
-            QPushButton#primary:hover {{
-                background-color: {COLORS['accent_green']};
-            }}
-        """)
-        csp_btn.clicked.connect(lambda: self._open_dialog('CSP'))
+        csp_btn = _action_button("+ CSP", "csp_button", self._open_csp)
         layout.addWidget(csp_btn)
         
         # Add CC button
-        cc_btn = QPushButton("+ Covered Call")
-        cc_btn.setCursor(Qt.PointingHandCursor)
-        cc_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {COLORS['bg_card']};
-                border: 1px solid {COLORS['border']};
-                color: {COLORS['text_primary']};
-                font-weight: 500;
-                padding: 10px 20px;
-                border-radius: 6px;
-            }}
-            QPushButton:hover {{
-                background-color: {COLORS['bg_hover']};
-                border-color: {COLORS['text_muted']};
-            }}
-        """)
-        cc_btn.clicked.connect(lambda: self._open_dialog('CC'))
+        cc_btn = _action_button("+ Covered Call", "cc_button", self._open_cc)
         layout.addWidget(cc_btn)
         
         # More options
-        more_btn = QPushButton("More...")
-        more_btn.setCursor(Qt.PointingHandCursor)
-        more_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                border: none;
-                color: {COLORS['text_primary']};
-                padding: 10px 16px;
-            }}
-            QPushButton:hover {{
-                color: {COLORS['text_primary']};
-            }}
-        """)
-        more_btn.clicked.connect(lambda: self._open_dialog(None))
+        more_btn = _action_button("More...", "more_button", self._open_more)
         layout.addWidget(more_btn)
         
         layout.addStretch()
     
+    def _open_csp(self):
+        """Open the trade entry dialog on the CSP tab."""
+        self._open_dialog('CSP')
+    
+    def _open_cc(self):
+        """Open the trade entry dialog on the CC tab."""
+        self._open_dialog('CC')
+    
+    def _open_more(self):
+        """Open the trade entry dialog on its first tab."""
+        self._open_dialog(None)
+    
     def _open_dialog(self, trade_type: str = None):
-        """Open the trade entry dialog."""
-        dialog = TradeEntryDialog(self, trade_type)
-        dialog.trade_added.connect(self.trade_added.emit)
-        dialog.exec()
+        """Open the trade entry dialog, built on first use and reset on later opens."""
+        if self._dialog is None:
+            self._dialog = TradeEntryDialog(self, trade_type)
+            self._dialog.trade_added.connect(self.trade_added.emit)
+        else:
+            self._dialog.reset()
+            self._dialog.select_trade_type(trade_type)
+        self._dialog.exec()
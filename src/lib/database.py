@@ -4,17 +4,83 @@ Handles all database operations for positions, trades, settings, and snapshots.
 Supports demo mode with sample data and active mode for real data.
 """
 
-import sqlite3
 import calendar
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from datetime import datetime, date, timedelta
+from datetime import datetime, date, timedelta, timezone
 from typing import Optional
 import random
 
+try:
+    # Optional: pysqlite3-binary bundles a newer SQLite than some Pythons ship
+    from pysqlite3 import dbapi2 as sqlite3
+except ImportError:
+    import sqlite3
+
+
+# Statements on the trade entry path; sqlite3 keys its per-connection
+# statement cache on the SQL text, so these are prepared once per connection
+_SELECT_POSITION_SQL = "SELECT * FROM positions WHERE ticker = ?"
+_INSERT_POSITION_SQL = """
+    INSERT INTO positions (ticker, shares_owned, cost_basis)
+    VALUES (?, ?, ?)
+"""
+_INSERT_POSITION_RETURNING_SQL = _INSERT_POSITION_SQL + "RETURNING *\n"
+
+# INSERT ... RETURNING needs SQLite 3.35 or newer
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+_INSERT_TRADE_SQL = """
+    INSERT INTO trades (position_id, type, ticker, strike, expiration, premium, quantity, delta, notes)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Filtered and partial-update statements are spelled out once so every call
+# hands the statement cache the same SQL text. NULL parameters keep the
+# current column value.
+_SELECT_TRADES_SQL = {
+    (has_status, has_type): (
+        "SELECT * FROM trades WHERE 1=1"
+        + (" AND status = ?" if has_status else "")
+        + (" AND type = ?" if has_type else "")
+        + " ORDER BY opened_at DESC"
+    )
+    for has_status in (False, True)
+    for has_type in (False, True)
+}
+_UPDATE_POSITION_SQL = """
+    UPDATE positions
+    SET shares_owned = COALESCE(?, shares_owned),
+        cost_basis = COALESCE(?, cost_basis),
+        current_price = COALESCE(?, current_price),
+        updated_at = CURRENT_TIMESTAMP
+    WHERE id = ?
+"""
+_UPDATE_TRADE_SQL = """
+    UPDATE trades
+    SET status = COALESCE(?, status),
+        closed_at = COALESCE(?, closed_at)
+    WHERE id = ?
+"""
+
+
+def _month_bounds(day: date) -> tuple[str, str]:
+    """Get the half-open ISO date range of the month containing a day."""
+    next_month = date(day.year + 1, 1, 1) if day.month == 12 else date(day.year, day.month + 1, 1)
+    return day.replace(day=1).isoformat(), next_month.isoformat()
+
+
+def _year_bounds(day: date) -> tuple[str, str]:
+    """Get the half-open ISO date range of the year containing a day."""
+    return date(day.year, 1, 1).isoformat(), date(day.year + 1, 1, 1).isoformat()
+
 
 class Database:
     """Database handler for the Wheel Strategy Tracker."""
     
+    # Let SQLite refresh its planner statistics after this many new trades
+    OPTIMIZE_EVERY = 100
+    
     def __init__(self, db_path: Optional[str] = None, demo_mode: bool = False):
         self.demo_mode = demo_mode
         
@@ -29,13 +95,145 @@ class Database:
                 db_path = str(data_dir / "wheel_tracker.db")
         
         self.db_path = db_path
-        self.conn = sqlite3.connect(db_path, check_same_thread=False)
-        self.conn.row_factory = sqlite3.Row
+        self.conn = self._connect()
+        self._trades_since_optimize = 0
+        
+        # Memoized reads are tagged with the write version they were loaded at
+        self._version = 0
+        self._cache: dict = {}
+        
+        # Worker threads read and write through their own connections
+        self._local = threading.local()
+        self._thread_conns: list[sqlite3.Connection] = []
+        self._thread_conns_lock = threading.Lock()
+        
+        # An in-memory database only exists on the connection that created
+        # it, so every thread shares that one and writes take turns on it
+        self._memory_write_lock = threading.RLock() if db_path == ":memory:" else None
         self._init_schema()
         
         # Populate demo data if demo mode and empty
         if demo_mode:
             self._ensure_demo_data()
+        
+        # Gather planner statistics once so the trade indexes get picked;
+        # PRAGMA optimize keeps them current from then on
+        has_stats = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+        ).fetchone()
+        if not has_stats:
+            self.conn.execute("ANALYZE")
+            self.conn.commit()
+    
+    def _connect(self, read_only: bool = False) -> sqlite3.Connection:
+        """Open a connection to the database file with the app's PRAGMAs applied."""
+        if read_only:
+            uri = f"{Path(self.db_path).resolve().as_uri()}?mode=ro"
+            conn = sqlite3.connect(uri, uri=True, check_same_thread=False, cached_statements=256)
+        else:
+            # Writers take the write lock when their transaction begins, so a
+            # read-then-write transaction never fails to upgrade under WAL
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=256,
+                                   isolation_level="IMMEDIATE")
+        conn.row_factory = sqlite3.Row
+        
+        # WAL lets dashboard reads run alongside trade writes and, with
+        # synchronous=NORMAL, only syncs at checkpoints instead of every commit
+        if self.db_path != ":memory:" and not read_only:
+            conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=30000")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-20000")
+        conn.execute("PRAGMA foreign_keys=ON")
+        return conn
+    
+    def _conn(self) -> sqlite3.Connection:
+        """Get the connection to use on the calling thread."""
+        if threading.current_thread() is threading.main_thread() or self._memory_write_lock is not None:
+            return self.conn
+        
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+            with self._thread_conns_lock:
+                self._thread_conns.append(conn)
+        return conn
+    
+    def release_thread_connections(self):
+        """Close the calling worker thread's connections once its database work is done."""
+        # Pool threads expire when idle, so connections left open on them
+        # would pile up over a long session
+        if threading.current_thread() is threading.main_thread():
+            return
+        
+        for name in ('conn', 'reader'):
+            conn = getattr(self._local, name, None)
+            if conn is not None:
+                setattr(self._local, name, None)
+                with self._thread_conns_lock:
+                    self._thread_conns.remove(conn)
+                conn.close()
+    
+    def _reader(self) -> sqlite3.Connection:
+        """Get the connection to run a read-only query on from the calling thread."""
+        # The main thread and open transactions read through their writer so
+        # they see their own uncommitted rows; an in-memory database cannot be
+        # opened a second time
+        if (threading.current_thread() is threading.main_thread()
+                or getattr(self._local, 'depth', 0)
+                or self.db_path == ":memory:"):
+            return self._conn()
+        
+        conn = getattr(self._local, 'reader', None)
+        if conn is None:
+            conn = self._connect(read_only=True)
+            self._local.reader = conn
+            with self._thread_conns_lock:
+                self._thread_conns.append(conn)
+        return conn
+    
+    @contextmanager
+    def transaction(self):
+        """Group several writes into one commit, rolling them all back on error."""
+        # Nesting depth is per thread since each thread has its own connection
+        conn = self._conn()
+        lock = self._memory_write_lock
+        if lock is not None:
+            lock.acquire()
+        depth = getattr(self._local, 'depth', 0)
+        self._local.depth = depth + 1
+        try:
+            yield
+        except BaseException:
+            if depth == 0:
+                conn.rollback()
+            raise
+        else:
+            if depth == 0:
+                conn.commit()
+        finally:
+            self._local.depth = depth
+            self._version += 1
+            if lock is not None:
+                lock.release()
+    
+    def _cached(self, key, load):
+        """Return a read's memoized result, reloading it after any write."""
+        # Reads inside a transaction may see uncommitted rows, so they are
+        # neither served from nor stored in the shared cache
+        if getattr(self._local, 'depth', 0):
+            return load()
+        
+        version = self._version
+        hit = self._cache.get(key)
+        if hit is not None and hit[0] == version:
+            return hit[1]
+        
+        value = load()
+        self._cache[key] = (version, value)
+        return value
     
     def _init_schema(self):
         """Initialize database schema."""
@@ -74,24 +272,51 @@ class Database:
             )
         """)
         
-        # Settings table - app configuration
-        cursor.execute("""
+        # Premium, performer and position queries filter trades by type, status
+        # and date or group them by ticker/position. snapshot_date is already
+        # indexed through its UNIQUE constraint.
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_trades_type_status_opened ON trades(type, status, opened_at)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_trades_position ON trades(position_id)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_trades_ticker_type_status ON trades(ticker, type, status)")
+        
+        # Settings and snapshots are looked up by their natural key, so they
+        # are stored WITHOUT ROWID directly in their primary key B-tree
+        settings_sql = """
             CREATE TABLE IF NOT EXISTS settings (
                 key TEXT PRIMARY KEY,
                 value TEXT NOT NULL
-            )
-        """)
-        
-        # Snapshots table - daily portfolio snapshots
-        cursor.execute("""
+            ) WITHOUT ROWID
+        """
+        snapshots_sql = """
             CREATE TABLE IF NOT EXISTS snapshots (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                snapshot_date DATE UNIQUE,
+                snapshot_date DATE PRIMARY KEY,
                 portfolio_value REAL DEFAULT 0.0,
                 options_pnl REAL DEFAULT 0.0,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            ) WITHOUT ROWID
+        """
+        # DDL does not open a transaction on its own, so the rebuilds run in an
+        # explicit one; an interrupted migration then leaves the old tables as
+        # they were instead of stranding their rows in a *_old copy
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            self._rebuild_without_rowid(cursor, 'settings', settings_sql, "key, value")
+            self._rebuild_without_rowid(
+                cursor, 'snapshots', snapshots_sql,
+                "snapshot_date, portfolio_value, options_pnl, created_at",
+                where="snapshot_date IS NOT NULL"
             )
-        """)
+        except BaseException:
+            self.conn.rollback()
+            raise
+        else:
+            self.conn.commit()
+        
+        # Settings table - app configuration
+        cursor.execute(settings_sql)
+        
+        # Snapshots table - daily portfolio snapshots
+        cursor.execute(snapshots_sql)
         
         # Portfolio info table - configurable portfolio details
         cursor.execute("""
@@ -130,6 +355,19 @@ class Database:
         
         self.conn.commit()
     
+    def _rebuild_without_rowid(self, cursor: sqlite3.Cursor, table: str, create_sql: str,
+                               columns: str, where: str = "1"):
+        """Copy a table created by an older version into its WITHOUT ROWID layout."""
+        cursor.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table,))
+        row = cursor.fetchone()
+        if row is None or 'WITHOUT ROWID' in row['sql'].upper():
+            return
+        
+        cursor.execute(f"ALTER TABLE {table} RENAME TO {table}_old")
+        cursor.execute(create_sql)
+        cursor.execute(f"INSERT INTO {table} ({columns}) SELECT {columns} FROM {table}_old WHERE {where}")
+        cursor.execute(f"DROP TABLE {table}_old")
+    
     def _ensure_demo_data(self):
         """Ensure demo database has sample data."""
         cursor = self.conn.cursor()
@@ -159,63 +397,82 @@ class Database:
             ("NIO", 0, 5),
         ]
         
-        from datetime import timedelta
-        
         # First trade date is Jan 6, 2026 (start of Week 1)
         first_trade_date = datetime(2026, 1, 6)
         
-        for i, (ticker, cc_premium, csp_premium) in enumerate(tickers):
-            # Create position
-            pos = self.get_or_create_position(ticker)
-            
-            # Add some shares for tickers with covered calls
-            if cc_premium > 0:
-                self.update_position(pos['id'], shares=100, cost_basis=random.uniform(10, 50))
-            
-            # Spread trades across the first few weeks of 2026
-            trade_date = first_trade_date + timedelta(days=i % 12)
-            
-            # Add covered call trade if applicable
-            if cc_premium > 0:
-                exp_date = (trade_date + timedelta(days=random.randint(14, 45))).strftime("%Y-%m-%d")
-                cursor = self.conn.cursor()
-                cursor.execute("""
+        # A fixed seed makes every freshly built demo database identical
+        rng = random.Random(42)
+        
+        # Collect every row first and write each table in one batch and one commit
+        share_rows = []
+        cc_rows = []
+        csp_rows = []
+        
+        # The demo database can always be regenerated, so the bulk load skips
+        # syncing to disk and checks trade foreign keys once at commit
+        conn = self._conn()
+        conn.execute("PRAGMA synchronous=OFF")
+        
+        try:
+            with self.transaction():
+                conn.execute("PRAGMA defer_foreign_keys=ON")
+                position_ids = {ticker: self.get_or_create_position(ticker)['id'] for ticker, _, _ in tickers}
+                
+                for i, (ticker, cc_premium, csp_premium) in enumerate(tickers):
+                    position_id = position_ids[ticker]
+                    
+                    # Add some shares for tickers with covered calls
+                    if cc_premium > 0:
+                        share_rows.append((100, rng.uniform(10, 50), position_id))
+                    
+                    # Spread trades across the first few weeks of 2026
+                    trade_date = first_trade_date + timedelta(days=i % 12)
+                    opened_at = trade_date.strftime("%Y-%m-%d %H:%M:%S")
+                    
+                    # Add covered call trade if applicable
+                    if cc_premium > 0:
+                        exp_date = (trade_date + timedelta(days=rng.randint(14, 45))).strftime("%Y-%m-%d")
+                        cc_rows.append((
+                            position_id,
+                            'CC',
+                            ticker,
+                            rng.uniform(15, 100),
+                            exp_date,
+                            cc_premium / 100,
+                            1,
+                            rng.uniform(0.10, 0.25),
+                            opened_at,
+                            opened_at
+                        ))
+                    
+                    # Add CSP trade if applicable
+                    if csp_premium > 0:
+                        exp_date = (trade_date + timedelta(days=rng.randint(14, 45))).strftime("%Y-%m-%d")
+                        csp_rows.append((
+                            position_id,
+                            'CSP',
+                            ticker,
+                            rng.uniform(10, 50),
+                            exp_date,
+                            csp_premium / 100,
+                            1,
+                            rng.uniform(-0.20, -0.10),
+                            opened_at,
+                            opened_at
+                        ))
+                
+                cursor = conn.cursor()
+                cursor.executemany("""
+                    UPDATE positions SET shares_owned = ?, cost_basis = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?
+                """, share_rows)
+                insert_trade = """
                     INSERT INTO trades (position_id, type, ticker, strike, expiration, premium, quantity, delta, status, opened_at, closed_at)
                     VALUES (?, ?, ?, ?, ?, ?, ?, ?, 'EXPIRED', ?, ?)
-                """, (
-                    pos['id'],
-                    'CC',
-                    ticker,
-                    random.uniform(15, 100),
-                    exp_date,
-                    cc_premium / 100,
-                    1,
-                    random.uniform(0.10, 0.25),
-                    trade_date.strftime("%Y-%m-%d %H:%M:%S"),
-                    trade_date.strftime("%Y-%m-%d %H:%M:%S")
-                ))
-            
-            # Add CSP trade if applicable
-            if csp_premium > 0:
-                exp_date = (trade_date + timedelta(days=random.randint(14, 45))).strftime("%Y-%m-%d")
-                cursor = self.conn.cursor()
-                cursor.execute("""
-                    INSERT INTO trades (position_id, type, ticker, strike, expiration, premium, quantity, delta, status, opened_at, closed_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, 'EXPIRED', ?, ?)
-                """, (
-                    pos['id'],
-                    'CSP',
-                    ticker,
-                    random.uniform(10, 50),
-                    exp_date,
-                    csp_premium / 100,
-                    1,
-                    random.uniform(-0.20, -0.10),
-                    trade_date.strftime("%Y-%m-%d %H:%M:%S"),
-                    trade_date.strftime("%Y-%m-%d %H:%M:%S")
-                ))
-        
-        self.conn.commit()
+                """
+                cursor.executemany(insert_trade, cc_rows)
+                cursor.executemany(insert_trade, csp_rows)
+        finally:
+            conn.execute("PRAGMA synchronous=NORMAL")
         
         # Add sample portfolio info for demo
         self.save_portfolio_info(
@@ -233,93 +490,87 @@ class Database:
     
     def get_all_positions(self) -> list[dict]:
         """Get all positions with their premium summaries."""
-        cursor = self.conn.cursor()
-        cursor.execute("""
+        cursor = self._reader().execute("""
             SELECT 
                 p.*,
-                COALESCE(SUM(CASE WHEN t.type = 'CC' AND t.status != 'OPEN' THEN t.premium * t.quantity * 100 ELSE 0 END), 0) as cc_premium,
-                COALESCE(SUM(CASE WHEN t.type = 'CSP' AND t.status != 'OPEN' THEN t.premium * t.quantity * 100 ELSE 0 END), 0) as csp_premium,
-                COALESCE(SUM(CASE WHEN t.type IN ('CC', 'CSP') AND t.status != 'OPEN' THEN t.premium * t.quantity * 100 ELSE 0 END), 0) as total_premium
+                COALESCE(t.cc_premium, 0) as cc_premium,
+                COALESCE(t.csp_premium, 0) as csp_premium,
+                COALESCE(t.total_premium, 0) as total_premium
             FROM positions p
-            LEFT JOIN trades t ON p.id = t.position_id
-            GROUP BY p.id
+            LEFT JOIN (
+                -- Aggregate the closed trades once per position before joining
+                SELECT 
+                    position_id,
+                    SUM(CASE WHEN type = 'CC' THEN premium * quantity * 100 ELSE 0 END) as cc_premium,
+                    SUM(CASE WHEN type = 'CSP' THEN premium * quantity * 100 ELSE 0 END) as csp_premium,
+                    SUM(premium * quantity * 100) as total_premium
+                FROM trades
+                WHERE type IN ('CC', 'CSP') AND status != 'OPEN'
+                GROUP BY position_id
+            ) t ON t.position_id = p.id
             ORDER BY total_premium DESC
         """)
         return [dict(row) for row in cursor.fetchall()]
     
     def get_position(self, ticker: str) -> Optional[dict]:
         """Get a single position by ticker."""
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM positions WHERE ticker = ?", (ticker.upper(),))
-        row = cursor.fetchone()
+        row = self._reader().execute(_SELECT_POSITION_SQL, (ticker.upper(),)).fetchone()
         return dict(row) if row else None
     
     def create_position(self, ticker: str, shares: int = 0, cost_basis: float = 0.0) -> int:
         """Create a new position."""
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            INSERT INTO positions (ticker, shares_owned, cost_basis)
-            VALUES (?, ?, ?)
-        """, (ticker.upper(), shares, cost_basis))
-        self.conn.commit()
-        return cursor.lastrowid
+        return self._insert_position(ticker, shares, cost_basis)['id']
+    
+    def _insert_position(self, ticker: str, shares: int, cost_basis: float) -> dict:
+        """Insert a position and return its row."""
+        with self.transaction():
+            cursor = self._conn().cursor()
+            if _HAS_RETURNING:
+                cursor.execute(_INSERT_POSITION_RETURNING_SQL, (ticker.upper(), shares, cost_basis))
+                position = dict(cursor.fetchone())
+            else:
+                cursor.execute(_INSERT_POSITION_SQL, (ticker.upper(), shares, cost_basis))
+                position = {'id': cursor.lastrowid, 'ticker': ticker.upper(), 'shares_owned': shares, 'cost_basis': cost_basis}
+        return position
     
     def update_position(self, position_id: int, shares: int = None, cost_basis: float = None, current_price: float = None):
         """Update a position."""
-        updates = []
-        values = []
-        
-        if shares is not None:
-            updates.append("shares_owned = ?")
-            values.append(shares)
-        if cost_basis is not None:
-            updates.append("cost_basis = ?")
-            values.append(cost_basis)
-        if current_price is not None:
-            updates.append("current_price = ?")
-            values.append(current_price)
-        
-        if updates:
-            updates.append("updated_at = CURRENT_TIMESTAMP")
-            values.append(position_id)
-            
-            cursor = self.conn.cursor()
-            cursor.execute(f"""
-                UPDATE positions SET {', '.join(updates)} WHERE id = ?
-            """, values)
-            self.conn.commit()
+        if shares is None and cost_basis is None and current_price is None:
+            return
+        
+        with self.transaction():
+            cursor = self._conn().cursor()
+            cursor.execute(_UPDATE_POSITION_SQL, (shares, cost_basis, current_price, position_id))
     
     def get_or_create_position(self, ticker: str) -> dict:
         """Get existing position or create new one."""
         position = self.get_position(ticker)
         if not position:
-            position_id = self.create_position(ticker)
-            position = {'id': position_id, 'ticker': ticker.upper(), 'shares_owned': 0, 'cost_basis': 0.0}
+            position = self._insert_position(ticker, 0, 0.0)
         return position
     
     # ==================== TRADES ====================
     
     def get_all_trades(self, status: str = None, trade_type: str = None) -> list[dict]:
         """Get all trades with optional filtering."""
-        cursor = self.conn.cursor()
-        query = "SELECT * FROM trades WHERE 1=1"
-        params = []
-        
-        if status:
-            query += " AND status = ?"
-            params.append(status)
-        if trade_type:
-            query += " AND type = ?"
-            params.append(trade_type)
-        
-        query += " ORDER BY opened_at DESC"
-        cursor.execute(query, params)
+        cursor = self._query_trades(self._reader().cursor(), status, trade_type)
         return [dict(row) for row in cursor.fetchall()]
     
+    def get_trades_table(self, status: str = None, trade_type: str = None) -> tuple[list[str], list[tuple]]:
+        """Get trades as column names and plain row tuples, without a dict per row."""
+        cursor = self._reader().cursor()
+        cursor.row_factory = None
+        cursor = self._query_trades(cursor, status, trade_type)
+        return [column[0] for column in cursor.description], cursor.fetchall()
+    
+    def _query_trades(self, cursor: sqlite3.Cursor, status: str = None, trade_type: str = None) -> sqlite3.Cursor:
+        """Run the filtered trades query on a cursor."""
+        params = [value for value in (status, trade_type) if value]
+        return cursor.execute(_SELECT_TRADES_SQL[bool(status), bool(trade_type)], params)
+    
     def get_trades_for_position(self, position_id: int) -> list[dict]:
         """Get all trades for a position."""
-        cursor = self.conn.cursor()
-        cursor.execute("""
+        cursor = self._reader().execute("""
             SELECT * FROM trades WHERE position_id = ? ORDER BY opened_at DESC
         """, (position_id,))
         return [dict(row) for row in cursor.fetchall()]
@@ -328,35 +579,26 @@ class Database:
                      expiration: str = None, premium: float = 0.0, quantity: int = 1,
                      delta: float = None, notes: str = None) -> int:
         """Create a new trade."""
-        position = self.get_or_create_position(ticker)
+        with self.transaction():
+            position = self.get_or_create_position(ticker)
+            
+            cursor = self._conn().cursor()
+            cursor.execute(_INSERT_TRADE_SQL, (position['id'], trade_type, ticker.upper(), strike, expiration, premium, quantity, delta, notes))
         
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            INSERT INTO trades (position_id, type, ticker, strike, expiration, premium, quantity, delta, notes)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (position['id'], trade_type, ticker.upper(), strike, expiration, premium, quantity, delta, notes))
-        self.conn.commit()
+        self._trades_since_optimize += 1
+        if self._trades_since_optimize >= self.OPTIMIZE_EVERY and not getattr(self._local, 'depth', 0):
+            self._trades_since_optimize = 0
+            self._conn().execute("PRAGMA optimize")
         return cursor.lastrowid
     
     def update_trade(self, trade_id: int, status: str = None, closed_at: str = None):
         """Update trade status."""
-        updates = []
-        values = []
-        
-        if status:
-            updates.append("status = ?")
-            values.append(status)
-        if closed_at:
-            updates.append("closed_at = ?")
-            values.append(closed_at)
-        
-        if updates:
-            values.append(trade_id)
-            cursor = self.conn.cursor()
-            cursor.execute(f"""
-                UPDATE trades SET {', '.join(updates)} WHERE id = ?
-            """, values)
-            self.conn.commit()
+        if not status and not closed_at:
+            return
+        
+        with self.transaction():
+            cursor = self._conn().cursor()
+            cursor.execute(_UPDATE_TRADE_SQL, (status or None, closed_at or None, trade_id))
     
     def close_trade(self, trade_id: int, status: str = 'CLOSED'):
         """Close a trade."""
@@ -366,16 +608,17 @@ class Database:
     
     def get_first_trade_date(self) -> Optional[date]:
         """Get the date of the first trade (start of Week 1)."""
-        cursor = self.conn.cursor()
-        cursor.execute("""
+        return self._cached('first_trade_date', self._load_first_trade_date)
+    
+    def _load_first_trade_date(self) -> Optional[date]:
+        """Query the date of the first trade."""
+        cursor = self._reader().execute("""
             SELECT MIN(date(opened_at)) as first_date
             FROM trades 
             WHERE type IN ('CC', 'CSP')
         """)
         row = cursor.fetchone()
-        if row and row['first_date']:
-            return datetime.strptime(row['first_date'], "%Y-%m-%d").date()
-        return None
+        return date.fromisoformat(row['first_date']) if row and row['first_date'] else None
     
     def get_current_week_number(self) -> int:
         """Get the current week number based on first trade date."""
@@ -389,77 +632,64 @@ class Database:
     
     def get_premium_summary(self) -> dict:
         """Get premium summary for different time periods."""
-        cursor = self.conn.cursor()
         today = date.today()
+        today_ord = today.toordinal()
         
         # Get first trade date for week calculation
         first_trade = self.get_first_trade_date()
-        week_number = self.get_current_week_number()
         
-        # Calculate current week's start date based on first trade
+        # Calculate current week's start date based on first trade; day
+        # arithmetic is done on ordinals rather than timedelta objects
         if first_trade:
-            weeks_elapsed = (today - first_trade).days // 7
-            current_week_start = first_trade + timedelta(days=weeks_elapsed * 7)
+            first_ord = first_trade.toordinal()
+            weeks_elapsed = (today_ord - first_ord) // 7
+            current_week_start = date.fromordinal(first_ord + weeks_elapsed * 7)
+            week_number = weeks_elapsed + 1
         else:
             current_week_start = today
-        
-        # This week's premium (based on first trade date)
-        cursor.execute("""
-            SELECT COALESCE(SUM(premium * quantity * 100), 0) as total
-            FROM trades 
-            WHERE type IN ('CC', 'CSP') 
-            AND status != 'OPEN'
-            AND date(opened_at) >= ?
-        """, (current_week_start.isoformat(),))
-        week_premium = cursor.fetchone()['total']
-        
-        # This month's premium
-        cursor.execute("""
-            SELECT COALESCE(SUM(premium * quantity * 100), 0) as total
-            FROM trades 
-            WHERE type IN ('CC', 'CSP') 
-            AND status != 'OPEN'
-            AND strftime('%Y-%m', opened_at) = strftime('%Y-%m', 'now')
-        """)
-        month_premium = cursor.fetchone()['total']
-        
-        # YTD premium (based on first trade year, not calendar year)
-        if first_trade:
-            start_year = first_trade.year
-        else:
-            start_year = today.year
-            
-        cursor.execute("""
-            SELECT COALESCE(SUM(premium * quantity * 100), 0) as total
+            week_number = 0  # No trades yet
+        
+        # The month follows SQLite's 'now', which is UTC
+        month_start, month_end = _month_bounds(datetime.now(timezone.utc).date())
+        
+        # One pass over the closed trades gives each year's total along with
+        # its share of this week's and this month's premium. ISO timestamps
+        # compare as plain strings against the bound dates.
+        cursor = self._reader().execute("""
+            SELECT strftime('%Y', opened_at) as year,
+                   SUM(premium * quantity * 100) as total,
+                   SUM(CASE WHEN opened_at >= ? THEN premium * quantity * 100 ELSE 0 END) as week,
+                   SUM(CASE WHEN opened_at >= ? AND opened_at < ?
+                            THEN premium * quantity * 100 ELSE 0 END) as month
             FROM trades 
             WHERE type IN ('CC', 'CSP') 
             AND status != 'OPEN'
-            AND strftime('%Y', opened_at) = ?
-        """, (str(start_year),))
-        ytd_premium = cursor.fetchone()['total']
+            GROUP BY year
+            ORDER BY year DESC
+        """, (current_week_start.isoformat(), month_start, month_end))
         
         # All years with trades (for historical display)
         yearly_premiums = {}
-        cursor.execute("""
-            SELECT strftime('%Y', opened_at) as year, 
-                   COALESCE(SUM(premium * quantity * 100), 0) as total
-            FROM trades 
-            WHERE type IN ('CC', 'CSP') 
-            AND status != 'OPEN'
-            GROUP BY year
-            ORDER BY year DESC
-        """)
+        week_premium = 0
+        month_premium = 0
         for row in cursor.fetchall():
             yearly_premiums[row['year']] = row['total']
+            week_premium += row['week']
+            month_premium += row['month']
+        
+        # YTD premium (based on first trade year, not calendar year) is
+        # already one of the yearly totals
+        start_year = first_trade.year if first_trade else today.year
+        ytd_premium = yearly_premiums.get(str(start_year), 0)
         
         # Calculate year-end projection based on days since first trade
         if first_trade and first_trade.year == today.year:
-            days_elapsed = (today - first_trade).days + 1
-            days_remaining_in_year = (date(today.year, 12, 31) - today).days
+            days_elapsed = today_ord - first_ord + 1
+            days_remaining_in_year = date(today.year, 12, 31).toordinal() - today_ord
             total_days = days_elapsed + days_remaining_in_year
             projected = (ytd_premium / days_elapsed) * total_days if days_elapsed > 0 else 0
         else:
-            days_elapsed = (today - today.replace(month=1, day=1)).days + 1
+            days_elapsed = today.timetuple().tm_yday
             days_in_year = 366 if calendar.isleap(today.year) else 365
             projected = (ytd_premium / days_elapsed) * days_in_year if days_elapsed > 0 else 0
         
@@ -475,24 +705,25 @@ class Database:
     
     def get_top_performers(self, period: str = 'mtd', limit: int = 5) -> list[dict]:
         """Get top performing tickers by premium."""
-        cursor = self.conn.cursor()
-        
+        # Periods follow SQLite's 'now', which is UTC; a plain range on
+        # opened_at lets the type/status/opened_at index narrow the scan
+        today = datetime.now(timezone.utc).date()
         if period == 'mtd':
-            date_filter = "strftime('%Y-%m', opened_at) = strftime('%Y-%m', 'now')"
+            start, end = _month_bounds(today)
         else:  # ytd
-            date_filter = "strftime('%Y', opened_at) = strftime('%Y', 'now')"
+            start, end = _year_bounds(today)
         
-        cursor.execute(f"""
+        cursor = self._reader().execute("""
             SELECT ticker, 
                    COALESCE(SUM(premium * quantity * 100), 0) as total_premium
             FROM trades 
             WHERE type IN ('CC', 'CSP') 
             AND status != 'OPEN'
-            AND {date_filter}
+            AND opened_at >= ? AND opened_at < ?
             GROUP BY ticker
             ORDER BY total_premium DESC
             LIMIT ?
-        """, (limit,))
+        """, (start, end, limit))
         
         return [dict(row) for row in cursor.fetchall()]
     
@@ -500,41 +731,40 @@ class Database:
     
     def get_setting(self, key: str) -> Optional[str]:
         """Get a setting value."""
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT value FROM settings WHERE key = ?", (key,))
-        row = cursor.fetchone()
-        return row['value'] if row else None
+        return self._cached('settings', self._load_settings).get(key)
     
     def set_setting(self, key: str, value: str):
         """Set a setting value."""
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)
-        """, (key, value))
-        self.conn.commit()
+        with self.transaction():
+            cursor = self._conn().cursor()
+            cursor.execute("""
+                INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)
+            """, (key, value))
     
     def get_all_settings(self) -> dict:
         """Get all settings as a dictionary."""
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT key, value FROM settings")
-        return {row['key']: row['value'] for row in cursor.fetchall()}
+        return dict(self._cached('settings', self._load_settings))
+    
+    def _load_settings(self) -> dict:
+        """Query every setting."""
+        rows = self._reader().execute("SELECT key, value FROM settings").fetchall()
+        return {row['key']: row['value'] for row in rows}
     
     # ==================== SNAPSHOTS ====================
     
     def save_snapshot(self, portfolio_value: float, options_pnl: float):
         """Save a daily snapshot."""
-        cursor = self.conn.cursor()
         today = date.today().isoformat()
-        cursor.execute("""
-            INSERT OR REPLACE INTO snapshots (snapshot_date, portfolio_value, options_pnl)
-            VALUES (?, ?, ?)
-        """, (today, portfolio_value, options_pnl))
-        self.conn.commit()
+        with self.transaction():
+            cursor = self._conn().cursor()
+            cursor.execute("""
+                INSERT OR REPLACE INTO snapshots (snapshot_date, portfolio_value, options_pnl)
+                VALUES (?, ?, ?)
+            """, (today, portfolio_value, options_pnl))
     
     def get_snapshots(self, days: int = 365) -> list[dict]:
         """Get snapshots for the last N days."""
-        cursor = self.conn.cursor()
-        cursor.execute("""
+        cursor = self._reader().execute("""
             SELECT * FROM snapshots 
             WHERE snapshot_date >= date('now', ?)
             ORDER BY snapshot_date ASC
@@ -545,9 +775,7 @@ class Database:
     
     def get_portfolio_info(self) -> dict:
         """Get portfolio info."""
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM portfolio_info LIMIT 1")
-        row = cursor.fetchone()
+        row = self._reader().execute("SELECT * FROM portfolio_info LIMIT 1").fetchone()
         if row:
             return dict(row)
         return {
@@ -558,43 +786,51 @@ class Database:
     
     def save_portfolio_info(self, started_investing: str, philosophy: str, options_strategy: str):
         """Save or update portfolio info."""
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT id FROM portfolio_info LIMIT 1")
-        row = cursor.fetchone()
-        
-        if row:
-            cursor.execute("""
-                UPDATE portfolio_info 
-                SET started_investing = ?, philosophy = ?, options_strategy = ?, updated_at = CURRENT_TIMESTAMP
-                WHERE id = ?
-            """, (started_investing, philosophy, options_strategy, row['id']))
-        else:
-            cursor.execute("""
-                INSERT INTO portfolio_info (started_investing, philosophy, options_strategy)
-                VALUES (?, ?, ?)
-            """, (started_investing, philosophy, options_strategy))
-        self.conn.commit()
+        with self.transaction():
+            cursor = self._conn().cursor()
+            cursor.execute("SELECT id FROM portfolio_info LIMIT 1")
+            row = cursor.fetchone()
+            
+            if row:
+                cursor.execute("""
+                    UPDATE portfolio_info 
+                    SET started_investing = ?, philosophy = ?, options_strategy = ?, updated_at = CURRENT_TIMESTAMP
+                    WHERE id = ?
+                """, (started_investing, philosophy, options_strategy, row['id']))
+            else:
+                cursor.execute("""
+                    INSERT INTO portfolio_info (started_investing, philosophy, options_strategy)
+                    VALUES (?, ?, ?)
+                """, (started_investing, philosophy, options_strategy))
     
     def get_milestones(self) -> list[dict]:
         """Get portfolio milestones."""
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM portfolio_milestones ORDER BY sort_order ASC")
-        return [dict(row) for row in cursor.fetchall()]
+        rows = self._reader().execute("SELECT * FROM portfolio_milestones ORDER BY sort_order ASC").fetchall()
+        return [dict(row) for row in rows]
     
     def save_milestones(self, milestones: list[dict]):
         """Save portfolio milestones (replaces existing)."""
-        cursor = self.conn.cursor()
-        cursor.execute("DELETE FROM portfolio_milestones")
+        rows = [
+            (m.get('amount', 0), m.get('date_reached', ''), m.get('time_to_reach', ''), i)
+            for i, m in enumerate(milestones)
+        ]
         
-        for i, m in enumerate(milestones):
-            cursor.execute("""
+        # Replace the whole list atomically so a failed insert keeps the old one
+        with self.transaction():
+            cursor = self._conn().cursor()
+            cursor.execute("DELETE FROM portfolio_milestones")
+            cursor.executemany("""
                 INSERT INTO portfolio_milestones (amount, date_reached, time_to_reach, sort_order)
                 VALUES (?, ?, ?, ?)
-            """, (m.get('amount', 0), m.get('date_reached', ''), m.get('time_to_reach', ''), i))
-        self.conn.commit()
+            """, rows)
     
     def close(self):
         """Close the database connection."""
+        self.conn.execute("PRAGMA optimize")
+        with self._thread_conns_lock:
+            for conn in self._thread_conns:
+                conn.close()
+            self._thread_conns.clear()
         self.conn.close()
 
 
@@ -12,7 +12,7 @@ from PySide6.QtGui import QAction
 from datetime import datetime, timedelta
 import csv
 
-from .styles import COLORS, get_stylesheet, format_currency
+from .styles import COLORS, get_stylesheet, get_dashboard_stylesheet, format_currency
 from .lib.database import get_database, set_demo_mode, is_demo_mode
 from .lib.polygon_api import get_polygon_api
 
@@ -25,6 +25,35 @@ from .components.market_rankings import MarketRankingsCard, TopPerformersCard
 from .components.settings_page import SettingsPage
 
 
+# Demo toggle stylesheets are formatted once and only applied when the mode changes
+_DEMO_TOGGLE_QSS = f"""
+    QPushButton {{
+        background-color: {COLORS['accent_yellow']};
+        border: none;
+        color: {COLORS['bg_dark']};
+        font-weight: 600;
+        padding: 8px 16px;
+        border-radius: 6px;
+    }}
+    QPushButton:hover {{
+        background-color: #fbbf24;
+    }}
+"""
+_ACTIVE_TOGGLE_QSS = f"""
+    QPushButton {{
+        background-color: {COLORS['accent_green_dark']};
+        border: none;
+        color: {COLORS['bg_dark']};
+        font-weight: 600;
+        padding: 8px 16px;
+        border-radius: 6px;
+    }}
+    QPushButton:hover {{
+        background-color: {COLORS['accent_green']};
+    }}
+"""
+
+
 class MainWindow(QMainWindow):
     """Main application window."""
     
@@ -111,7 +140,7 @@ class MainWindow(QMainWindow):
         scroll.setStyleSheet("QScrollArea { border: none; background-color: transparent; }")
         
         container = QWidget()
-        container.setStyleSheet(f"background-color: {COLORS['bg_dark']};")
+        container.setStyleSheet(get_dashboard_stylesheet())
         
         main_layout = QVBoxLayout(container)
         main_layout.setSpacing(20)
@@ -247,36 +276,12 @@ class MainWindow(QMainWindow):
     
     def _update_demo_button_style(self):
         """Update the demo toggle button style based on state."""
-        if is_demo_mode():
-            self.demo_toggle.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {COLORS['accent_yellow']};
-                    border: none;
-                    color: {COLORS['bg_dark']};
-                    font-weight: 600;
-                    padding: 8px 16px;
-                    border-radius: 6px;
-                }}
-                QPushButton:hover {{
-                    background-color: #fbbf24;
-                }}
-            """)
-            self.demo_toggle.setText("📊 Demo Mode")
-        else:
-            self.demo_toggle.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {COLORS['accent_green_dark']};
-                    border: none;
-                    color: {COLORS['bg_dark']};
-                    font-weight: 600;
-                    padding: 8px 16px;
-                    border-radius: 6px;
-                }}
-                QPushButton:hover {{
-                    background-color: {COLORS['accent_green']};
-                }}
-            """)
-            self.demo_toggle.setText("📈 Active Mode")
+        demo = is_demo_mode()
+        qss = _DEMO_TOGGLE_QSS if demo else _ACTIVE_TOGGLE_QSS
+        # Re-applying the same sheet would make Qt parse and repolish it again
+        if self.demo_toggle.styleSheet() != qss:
+            self.demo_toggle.setStyleSheet(qss)
+        self.demo_toggle.setText("📊 Demo Mode" if demo else "📈 Active Mode")
     
     def _refresh_data(self):
         """Refresh all dashboard data."""
@@ -360,7 +365,7 @@ class MainWindow(QMainWindow):
     def _export_csv(self):
         """Export trades to CSV."""
         db = get_database()
-        trades = db.get_all_trades()
+        columns, trades = db.get_trades_table()
         
         if not trades:
             QMessageBox.information(self, "Export", "No trades to export.")
@@ -373,8 +378,8 @@ class MainWindow(QMainWindow):
         if file_path:
             try:
                 with open(file_path, 'w', newline='') as f:
-                    writer = csv.DictWriter(f, fieldnames=trades[0].keys())
-                    writer.writeheader()
+                    writer = csv.writer(f)
+                    writer.writerow(columns)
                     writer.writerows(trades)
                 QMessageBox.information(self, "Success", f"Exported {len(trades)} trades to {file_path}")
             except Exception as e:
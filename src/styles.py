@@ -3,432 +3,560 @@ Stylesheet definitions for Wheel Strategy Tracker.
 Dark theme with green accents matching the reference design.
 """
 
-# Color palette
-COLORS = {
-    'bg_dark': '#0d0d0d',
-    'bg_primary': '#1a1a1a',
-    'bg_secondary': '#242424',
-    'bg_card': '#2a2a2a',
-    'bg_hover': '#333333',
-    'border': '#3a3a3a',
-    'text_primary': '#ffffff',
-    'text_secondary': '#a0a0a0',
-    'text_muted': '#666666',
-    'accent_green': '#4ade80',
-    'accent_green_dark': '#22c55e',
-    'accent_red': '#ef4444',
-    'accent_red_dark': '#dc2626',
-    'accent_blue': '#3b82f6',
-    'accent_yellow': '#eab308',
-}
-
-DARK_STYLESHEET = f"""
-/* Main Window */
-QMainWindow {{
-    background-color: {COLORS['bg_dark']};
-}}
-
-QWidget {{
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+
+# Color palette, read-only so every stylesheet built from it stays in sync.
+# The hex strings are interned so repeated colors share one object.
+COLORS = MappingProxyType({
+    'bg_dark': sys.intern('#0d0d0d'),
+    'bg_primary': sys.intern('#1a1a1a'),
+    'bg_secondary': sys.intern('#242424'),
+    'bg_card': sys.intern('#2a2a2a'),
+    'bg_hover': sys.intern('#333333'),
+    'border': sys.intern('#3a3a3a'),
+    'text_primary': sys.intern('#ffffff'),
+    'text_secondary': sys.intern('#a0a0a0'),
+    'text_muted': sys.intern('#666666'),
+    'accent_green': sys.intern('#4ade80'),
+    'accent_green_dark': sys.intern('#22c55e'),
+    'accent_red': sys.intern('#ef4444'),
+    'accent_red_dark': sys.intern('#dc2626'),
+    'accent_blue': sys.intern('#3b82f6'),
+    'accent_yellow': sys.intern('#eab308'),
+})
+
+# Stylesheets are %-format templates over the palette keys, so a palette is
+# filled in with one C-level formatting pass and another palette can be
+# rendered the same way. The window stylesheet is kept as fragments keyed by
+# every widget class their rules select, so a subset scoped to some classes
+# always carries each rule that styles them; the keyless fragment applies to
+# every widget and is always included. Base window, text and selection colors
+# come from get_palette(), so rules only set them where they differ from it.
+_DARK_FRAGMENTS = {
+    (): """
+/* All Widgets */
+QWidget {
     background-color: transparent;
-    color: {COLORS['text_primary']};
+    color: %(text_primary)s;
     font-family: 'SF Pro Display', 'Segoe UI', 'Helvetica Neue', sans-serif;
     font-size: 13px;
-}}
-
+}
+""",
+    ('QScrollArea', 'QScrollBar'): """
 /* Scroll Areas */
-QScrollArea {{
+QScrollArea {
     border: none;
     background-color: transparent;
-}}
+}
 
-QScrollBar:vertical {{
-    background-color: {COLORS['bg_secondary']};
+QScrollBar:vertical {
+    background-color: %(bg_secondary)s;
     width: 10px;
     border-radius: 5px;
-}}
+}
 
-QScrollBar::handle:vertical {{
-    background-color: {COLORS['border']};
+QScrollBar::handle:vertical {
+    background-color: %(border)s;
     border-radius: 5px;
     min-height: 30px;
-}}
+}
 
-QScrollBar::handle:vertical:hover {{
-    background-color: {COLORS['text_muted']};
-}}
+QScrollBar::handle:vertical:hover {
+    background-color: %(text_muted)s;
+}
 
-QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
+QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
     height: 0px;
-}}
-
+}
+""",
+    ('QFrame',): """
 /* Frames / Cards */
-QFrame {{
-    background-color: {COLORS['bg_secondary']};
-    border: 1px solid {COLORS['border']};
+QFrame {
+    background-color: %(bg_secondary)s;
+    border: 1px solid %(border)s;
     border-radius: 8px;
-}}
+}
 
-QFrame#card {{
-    background-color: {COLORS['bg_card']};
-    border: 1px solid {COLORS['border']};
+QFrame#card {
+    background-color: %(bg_card)s;
+    border: 1px solid %(border)s;
     border-radius: 12px;
     padding: 16px;
-}}
-
+}
+""",
+    ('QLabel',): """
 /* Labels */
-QLabel {{
+QLabel {
     background-color: transparent;
     border: none;
     padding: 0;
-}}
-
-QLabel#title {{
-    font-size: 24px;
-    font-weight: 600;
-    color: {COLORS['text_primary']};
-}}
-
-QLabel#subtitle {{
-    font-size: 14px;
-    color: {COLORS['text_secondary']};
-}}
-
-QLabel#value {{
-    font-size: 32px;
-    font-weight: 700;
-    color: {COLORS['text_primary']};
-}}
-
-QLabel#value_positive {{
-    font-size: 18px;
-    font-weight: 600;
-    color: {COLORS['accent_green']};
-}}
-
-QLabel#value_negative {{
-    font-size: 18px;
-    font-weight: 600;
-    color: {COLORS['accent_red']};
-}}
-
-QLabel#section_title {{
-    font-size: 16px;
-    font-weight: 600;
-    color: {COLORS['text_primary']};
-}}
-
+}
+""",
+    ('QPushButton',): """
 /* Buttons */
-QPushButton {{
-    background-color: {COLORS['bg_card']};
-    border: 1px solid {COLORS['border']};
+QPushButton {
+    background-color: %(bg_card)s;
+    border: 1px solid %(border)s;
     border-radius: 6px;
     padding: 8px 16px;
-    color: {COLORS['text_primary']};
     font-weight: 500;
-}}
+}
 
-QPushButton:hover {{
-    background-color: {COLORS['bg_hover']};
-    border-color: {COLORS['text_primary']};
-}}
+QPushButton:hover {
+    background-color: %(bg_hover)s;
+    border-color: %(text_primary)s;
+}
 
-QPushButton:pressed {{
-    background-color: {COLORS['bg_secondary']};
-}}
+QPushButton:pressed {
+    background-color: %(bg_secondary)s;
+}
 
-QPushButton#primary {{
-    background-color: {COLORS['accent_green_dark']};
+QPushButton#primary {
+    background-color: %(accent_green_dark)s;
     border: none;
-    color: {COLORS['bg_dark']};
+    color: %(bg_dark)s;
     font-weight: 600;
-}}
-
-QPushButton#primary:hover {{
-    background-color: {COLORS['accent_green']};
-}}
-
-QPushButton#danger {{
-    background-color: {COLORS['accent_red_dark']};
-    border: none;
-    color: white;
-}}
+}
 
-QPushButton#danger:hover {{
-    background-color: {COLORS['accent_red']};
-}}
+QPushButton#primary:hover {
+    background-color: %(accent_green)s;
+}
 
-QPushButton#tab {{
+QPushButton#tab {
     background-color: transparent;
     border: none;
     border-radius: 4px;
     padding: 6px 12px;
-    color: {COLORS['text_secondary']};
+    color: %(text_secondary)s;
     font-weight: 400;
-}}
+}
 
-QPushButton#tab:hover {{
-    background-color: {COLORS['bg_hover']};
-    color: {COLORS['text_primary']};
-}}
+QPushButton#tab:hover {
+    background-color: %(bg_hover)s;
+    color: %(text_primary)s;
+}
 
-QPushButton#tab:checked {{
-    background-color: {COLORS['bg_card']};
-    color: {COLORS['text_primary']};
+QPushButton#tab:checked {
+    background-color: %(bg_card)s;
+    color: %(text_primary)s;
     font-weight: 600;
-}}
-
+}
+""",
+    ('QLineEdit', 'QTextEdit', 'QPlainTextEdit', 'QComboBox', 'QSpinBox', 'QDoubleSpinBox', 'QDateEdit'): """
 /* Input Fields */
-QLineEdit {{
-    background-color: {COLORS['bg_primary']};
-    border: 1px solid {COLORS['border']};
+QLineEdit, QTextEdit, QPlainTextEdit, QComboBox, QSpinBox, QDoubleSpinBox, QDateEdit {
+    background-color: %(bg_primary)s;
+    border: 1px solid %(border)s;
     border-radius: 6px;
     padding: 8px 12px;
-    color: {COLORS['text_primary']};
-    selection-background-color: {COLORS['accent_green_dark']};
-}}
-
-QLineEdit:focus {{
-    border-color: {COLORS['accent_green']};
-}}
-
-QLineEdit:disabled {{
-    background-color: {COLORS['bg_secondary']};
-    color: {COLORS['text_muted']};
-}}
-
-QTextEdit {{
-    background-color: {COLORS['bg_primary']};
-    border: 1px solid {COLORS['border']};
-    border-radius: 6px;
+}
+
+QTextEdit, QPlainTextEdit {
     padding: 8px;
-    color: {COLORS['text_primary']};
-}}
+}
 
-/* Combo Box */
-QComboBox {{
-    background-color: {COLORS['bg_primary']};
-    border: 1px solid {COLORS['border']};
-    border-radius: 6px;
-    padding: 8px 12px;
-    color: {COLORS['text_primary']};
+QComboBox {
     min-width: 100px;
-}}
+}
 
-QComboBox:hover {{
-    border-color: {COLORS['text_muted']};
-}}
+QComboBox:hover {
+    border-color: %(text_muted)s;
+}
 
-QComboBox:focus {{
-    border-color: {COLORS['accent_green']};
-}}
+QLineEdit:focus, QComboBox:focus, QSpinBox:focus, QDoubleSpinBox:focus, QDateEdit:focus {
+    border-color: %(accent_green)s;
+}
 
-QComboBox::drop-down {{
+QLineEdit:disabled {
+    background-color: %(bg_secondary)s;
+    color: %(text_muted)s;
+}
+""",
+    ('QComboBox',): """
+/* Combo Box */
+QComboBox::drop-down {
     border: none;
     width: 20px;
-}}
+}
 
-QComboBox::down-arrow {{
+QComboBox::down-arrow {
     image: none;
     border-left: 4px solid transparent;
     border-right: 4px solid transparent;
-    border-top: 6px solid {COLORS['text_secondary']};
+    border-top: 6px solid %(text_secondary)s;
     margin-right: 8px;
-}}
+}
 
-QComboBox QAbstractItemView {{
-    background-color: {COLORS['bg_card']};
-    border: 1px solid {COLORS['border']};
-    border-radius: 6px;
-    selection-background-color: {COLORS['bg_hover']};
-    color: {COLORS['text_primary']};
-}}
-
-/* Spin Box */
-QSpinBox, QDoubleSpinBox {{
-    background-color: {COLORS['bg_primary']};
-    border: 1px solid {COLORS['border']};
+QComboBox QAbstractItemView {
+    background-color: %(bg_card)s;
+    border: 1px solid %(border)s;
     border-radius: 6px;
-    padding: 8px 12px;
-    color: {COLORS['text_primary']};
-}}
-
-QSpinBox:focus, QDoubleSpinBox:focus {{
-    border-color: {COLORS['accent_green']};
-}}
-
+    selection-background-color: %(bg_hover)s;
+}
+""",
+    ('QDateEdit', 'QCalendarWidget'): """
 /* Date Edit */
-QDateEdit {{
-    background-color: {COLORS['bg_primary']};
-    border: 1px solid {COLORS['border']};
-    border-radius: 6px;
-    padding: 8px 12px;
-    color: {COLORS['text_primary']};
-}}
-
-QDateEdit:focus {{
-    border-color: {COLORS['accent_green']};
-}}
-
-QDateEdit::drop-down {{
+QDateEdit::drop-down {
     border: none;
     width: 20px;
-}}
+}
 
-QCalendarWidget {{
-    background-color: {COLORS['bg_card']};
-}}
+QCalendarWidget {
+    background-color: %(bg_card)s;
+}
 
-QCalendarWidget QToolButton {{
-    color: {COLORS['text_primary']};
+QCalendarWidget QToolButton {
     background-color: transparent;
-}}
-
-QCalendarWidget QMenu {{
-    background-color: {COLORS['bg_card']};
-    color: {COLORS['text_primary']};
-}}
-
+}
+""",
+    ('QTableWidget', 'QHeaderView'): """
 /* Tables */
-QTableWidget {{
-    background-color: {COLORS['bg_secondary']};
-    border: 1px solid {COLORS['border']};
+QTableWidget {
+    background-color: %(bg_secondary)s;
+    border: 1px solid %(border)s;
     border-radius: 8px;
-    gridline-color: {COLORS['border']};
-}}
+    gridline-color: %(border)s;
+}
 
-QTableWidget::item {{
+QTableWidget::item {
     padding: 8px;
-    border-bottom: 1px solid {COLORS['border']};
-}}
+    border-bottom: 1px solid %(border)s;
+}
 
-QTableWidget::item:selected {{
-    background-color: {COLORS['bg_hover']};
-}}
+QTableWidget::item:selected {
+    background-color: %(bg_hover)s;
+}
 
-QHeaderView::section {{
-    background-color: {COLORS['bg_card']};
-    color: {COLORS['text_secondary']};
+QHeaderView::section {
+    background-color: %(bg_card)s;
+    color: %(text_secondary)s;
     padding: 10px 8px;
     border: none;
-    border-bottom: 1px solid {COLORS['border']};
+    border-bottom: 1px solid %(border)s;
     font-weight: 600;
-}}
-
+}
+""",
+    ('QTabWidget', 'QTabBar'): """
 /* Tab Widget */
-QTabWidget::pane {{
-    border: 1px solid {COLORS['border']};
+QTabWidget::pane {
+    border: 1px solid %(border)s;
     border-radius: 8px;
-    background-color: {COLORS['bg_secondary']};
-}}
+    background-color: %(bg_secondary)s;
+}
 
-QTabBar::tab {{
-    background-color: {COLORS['bg_secondary']};
-    color: {COLORS['text_secondary']};
+QTabBar::tab {
+    background-color: %(bg_secondary)s;
+    color: %(text_secondary)s;
     padding: 8px 16px;
     border: none;
     border-top-left-radius: 6px;
     border-top-right-radius: 6px;
-}}
-
-QTabBar::tab:selected {{
-    background-color: {COLORS['bg_card']};
-    color: {COLORS['text_primary']};
-}}
+}
 
-QTabBar::tab:hover:!selected {{
-    background-color: {COLORS['bg_hover']};
-}}
+QTabBar::tab:selected {
+    background-color: %(bg_card)s;
+    color: %(text_primary)s;
+}
 
+QTabBar::tab:hover:!selected {
+    background-color: %(bg_hover)s;
+}
+""",
+    ('QProgressBar',): """
 /* Progress Bar */
-QProgressBar {{
-    background-color: {COLORS['bg_primary']};
+QProgressBar {
+    background-color: %(bg_primary)s;
     border: none;
     border-radius: 4px;
     height: 8px;
     text-align: center;
-}}
+}
 
-QProgressBar::chunk {{
-    background-color: {COLORS['accent_green']};
+QProgressBar::chunk {
+    background-color: %(accent_green)s;
     border-radius: 4px;
-}}
-
+}
+""",
+    ('QToolTip',): """
 /* Tool Tips */
-QToolTip {{
-    background-color: {COLORS['bg_card']};
-    color: {COLORS['text_primary']};
-    border: 1px solid {COLORS['border']};
+QToolTip {
+    background-color: %(bg_card)s;
+    color: %(text_primary)s;
+    border: 1px solid %(border)s;
     border-radius: 4px;
     padding: 4px 8px;
-}}
-
+}
+""",
+    ('QMenu', 'QMenuBar'): """
 /* Menu */
-QMenuBar {{
-    background-color: {COLORS['bg_dark']};
-    color: {COLORS['text_primary']};
-}}
-
-QMenuBar::item:selected {{
-    background-color: {COLORS['bg_hover']};
-}}
-
-QMenu {{
-    background-color: {COLORS['bg_card']};
-    border: 1px solid {COLORS['border']};
+QMenuBar {
+    background-color: %(bg_dark)s;
+}
+
+QMenu {
+    background-color: %(bg_card)s;
+    border: 1px solid %(border)s;
     border-radius: 8px;
     padding: 4px;
-}}
+}
 
-QMenu::item {{
+QMenu::item {
     padding: 8px 24px;
     border-radius: 4px;
-}}
-
-QMenu::item:selected {{
-    background-color: {COLORS['bg_hover']};
-}}
+}
 
+QMenuBar::item:selected, QMenu::item:selected {
+    background-color: %(bg_hover)s;
+}
+""",
+    ('QDialog', 'QMessageBox'): """
 /* Dialogs */
-QDialog {{
-    background-color: {COLORS['bg_primary']};
-}}
-
-QMessageBox {{
-    background-color: {COLORS['bg_primary']};
-}}
-
+QDialog, QMessageBox {
+    background-color: %(bg_primary)s;
+}
+""",
+    ('QGroupBox',): """
 /* Group Box */
-QGroupBox {{
-    background-color: {COLORS['bg_secondary']};
-    border: 1px solid {COLORS['border']};
+QGroupBox {
+    background-color: %(bg_secondary)s;
+    border: 1px solid %(border)s;
     border-radius: 8px;
     margin-top: 16px;
     padding-top: 16px;
-}}
+}
 
-QGroupBox::title {{
-    color: {COLORS['text_secondary']};
+QGroupBox::title {
+    color: %(text_secondary)s;
     subcontrol-origin: margin;
     subcontrol-position: top left;
     padding: 0 8px;
-    background-color: {COLORS['bg_secondary']};
-}}
+    background-color: %(bg_secondary)s;
+}
+""",
+}
+
+
+# Dashboard page stylesheet, parsed once for every card on the page. The bare
+# background rule is what the page container always applied to its children,
+# so card rules have to live here to take precedence over it.
+_DASHBOARD_QSS = """
+* {
+    background-color: %(bg_dark)s;
+}
+
+QFrame#card {
+    background-color: %(bg_secondary)s;
+    border: 1px solid %(border)s;
+    border-radius: 12px;
+}
+
+QLabel#card_header {
+    font-size: 16px;
+    font-weight: 600;
+    color: %(text_primary)s;
+    background-color: %(bg_card)s;
+    padding: 8px 16px;
+    border-radius: 16px;
+}
+
+QLabel#card_title {
+    font-size: 16px;
+    font-weight: 600;
+    color: %(text_primary)s;
+}
+
+QLabel#card_caption {
+    font-size: 12px;
+    color: %(text_secondary)s;
+}
+
+QLabel#card_placeholder {
+    font-style: italic;
+    color: %(text_muted)s;
+}
+
+QLabel#card_footer {
+    font-size: 11px;
+    color: %(text_muted)s;
+}
+
+QLabel#period_label {
+    font-size: 14px;
+    color: %(text_primary)s;
+}
+
+QLabel#period_value {
+    font-size: 16px;
+    font-weight: 600;
+    color: %(accent_green)s;
+}
+
+QLabel#period_value[dim="true"] {
+    font-weight: normal;
+    color: %(text_secondary)s;
+}
+
+QLabel#period_projection {
+    font-size: 13px;
+    color: %(text_secondary)s;
+}
+
+QFrame#card_separator {
+    background-color: %(border)s;
+    border: none;
+}
+
+QPushButton#edit_button {
+    background-color: %(accent_green_dark)s;
+    border: none;
+    border-radius: 6px;
+    font-size: 13px;
+    color: %(bg_dark)s;
+    padding: 6px 12px;
+    font-weight: 600;
+}
+
+QPushButton#edit_button:hover {
+    background-color: %(accent_green)s;
+}
+
+QPushButton#csp_button {
+    background-color: %(accent_green_dark)s;
+    border: none;
+    color: %(bg_dark)s;
+    font-weight: 600;
+    padding: 10px 20px;
+    border-radius: 6px;
+}
+
+QPushButton#csp_button:hover {
+    background-color: %(accent_green)s;
+}
+
+QPushButton#cc_button {
+    background-color: %(bg_card)s;
+    border: 1px solid %(border)s;
+    color: %(text_primary)s;
+    font-weight: 500;
+    padding: 10px 20px;
+    border-radius: 6px;
+}
+
+QPushButton#cc_button:hover {
+    background-color: %(bg_hover)s;
+    border-color: %(text_muted)s;
+}
+
+QPushButton#more_button {
+    background-color: transparent;
+    border: none;
+    color: %(text_primary)s;
+    padding: 10px 16px;
+}
 """
 
+# Stylesheets are only rendered once something asks for them, so importing
+# this module for COLORS or the formatters does no stylesheet work
+_DEFAULT_PALETTE = tuple(sorted(COLORS.items()))
+
+
+def _palette_key(palette: dict = None) -> tuple:
+    """Get the sorted items a palette's renders are cached under."""
+    return _DEFAULT_PALETTE if palette is None else tuple(sorted(palette.items()))
+
+
+@lru_cache(maxsize=64)
+def _render(template: str, palette: tuple) -> str:
+    """Substitute a sorted palette into a stylesheet template."""
+    return template % dict(palette)
+
+
+@lru_cache(maxsize=16)
+def _build_stylesheet(palette: tuple, scope: frozenset = None) -> str:
+    """Join the rendered window stylesheet fragments that style a class in scope."""
+    return "".join(
+        _render(fragment, palette)
+        for classes, fragment in _DARK_FRAGMENTS.items()
+        if scope is None or not classes or not scope.isdisjoint(classes)
+    )
+
+
+def get_stylesheet(palette: dict = None, scope: set = None) -> str:
+    """Get the application stylesheet, optionally for another palette or only some widget classes."""
+    return _build_stylesheet(_palette_key(palette), None if scope is None else frozenset(scope))
+
+
+def get_dashboard_stylesheet(palette: dict = None) -> str:
+    """Get the stylesheet shared by the dashboard cards."""
+    return _render(_DASHBOARD_QSS, _palette_key(palette))
 
-def get_stylesheet() -> str:
-    """Get the application stylesheet."""
-    return DARK_STYLESHEET
 
+def __getattr__(name: str) -> str:
+    """Build the stylesheet constants on first access."""
+    if name == 'DARK_STYLESHEET':
+        return get_stylesheet()
+    if name == 'DASHBOARD_STYLESHEET':
+        return get_dashboard_stylesheet()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
+
+@lru_cache(maxsize=16)
+def _build_palette(palette: tuple):
+    """Build the application QPalette for a sorted palette."""
+    from PySide6.QtGui import QColor, QPalette
+
+    colors = dict(palette)
+    pal = QPalette()
+    for role, key in (
+        (QPalette.Window, 'bg_dark'),
+        (QPalette.WindowText, 'text_primary'),
+        (QPalette.Base, 'bg_primary'),
+        (QPalette.AlternateBase, 'bg_secondary'),
+        (QPalette.Text, 'text_primary'),
+        (QPalette.Button, 'bg_card'),
+        (QPalette.ButtonText, 'text_primary'),
+        (QPalette.Highlight, 'accent_green_dark'),
+        (QPalette.HighlightedText, 'text_primary'),
+        (QPalette.ToolTipBase, 'bg_card'),
+        (QPalette.ToolTipText, 'text_primary'),
+        (QPalette.PlaceholderText, 'text_muted'),
+    ):
+        pal.setColor(role, QColor(colors[key]))
+    for role in (QPalette.WindowText, QPalette.Text, QPalette.ButtonText):
+        pal.setColor(QPalette.Disabled, role, QColor(colors['text_muted']))
+    return pal
+
+
+def get_palette(palette: dict = None):
+    """Get the application QPalette carrying the theme's base colors."""
+    return _build_palette(_palette_key(palette))
+
+
+# Amounts below this still round to at most 999.99, so they never get a
+# thousands separator and can skip the grouping pass
+_UNGROUPED_LIMIT = 999.99
+
+
+@lru_cache(maxsize=4096)
 def format_currency(value: float) -> str:
     """Format a value as currency."""
     if value >= 0:
+        if value < _UNGROUPED_LIMIT:
+            return f"${value:.2f}"
         return f"${value:,.2f}"
-    return f"-${abs(value):,.2f}"
+    value = -value
+    if value < _UNGROUPED_LIMIT:
+        return f"-${value:.2f}"
+    return f"-${value:,.2f}"
+
+
+# Percent formats indexed by `value >= 0`; negatives already carry their sign
+_PERCENT_FORMATS = ("%.2f%%", "+%.2f%%")
 
 
+@lru_cache(maxsize=4096)
 def format_percent(value: float) -> str:
     """Format a value as percentage."""
-    sign = "+" if value >= 0 else ""
-    return f"{sign}{value:.2f}%"
+    return _PERCENT_FORMATS[value >= 0] % value